@@ -0,0 +1,112 @@
+import json
+
+import pandas as pd
+import pytest
+
+import vaila.resize_video as resize_video
+
+
+@pytest.fixture
+def yolo_csv(tmp_path):
+    """YOLO coordinates whose integer ID column is blank in one late chunk only."""
+    lines = ["Frame,ID_1,X_1,Y_1"]
+    for i in range(3000):
+        person_id = "" if 2500 <= i < 2510 else "1"
+        lines.append(f"{i},{person_id},{i * 0.5:.2f},{i * 0.25:.2f}")
+    csv_path = tmp_path / "pixels.csv"
+    csv_path.write_text("\n".join(lines) + "\n")
+
+    metadata_path = tmp_path / "metadata.json"
+    metadata_path.write_text(json.dumps({"scale_factor": 2, "crop_applied": False}))
+    return csv_path, metadata_path
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_streamed_conversion_matches_whole_file_read(
+    yolo_csv, tmp_path, monkeypatch, use_pyarrow
+):
+    csv_path, metadata_path = yolo_csv
+    if use_pyarrow:
+        if resize_video.pa is None:
+            pytest.skip("pyarrow is not installed")
+        monkeypatch.setattr(resize_video, "CSV_BLOCK_SIZE", 4096)
+    else:
+        monkeypatch.setattr(resize_video, "pa", None)
+    monkeypatch.setattr(resize_video, "CSV_CHUNK_SIZE", 500)
+
+    output_path = tmp_path / "original.csv"
+    assert resize_video.convert_mediapipe_coordinates(
+        str(csv_path), str(metadata_path), str(output_path), "yolo"
+    )
+
+    metadata = json.loads(metadata_path.read_text())
+    expected = resize_video.convert_coordinates_by_format(
+        pd.read_csv(csv_path), metadata, "yolo"
+    ).to_csv(index=False)
+    output_lines = output_path.read_text().splitlines()
+    expected_lines = expected.splitlines()
+    assert len(output_lines) == len(expected_lines)
+    mismatches = [
+        (line, wanted)
+        for line, wanted in zip(output_lines, expected_lines)
+        if line != wanted
+    ]
+    assert not mismatches, f"{len(mismatches)} rows differ, first: {mismatches[0]}"
+
+
+def test_pyarrow_failure_midway_falls_back_to_pandas(yolo_csv, tmp_path, monkeypatch):
+    """The pandas fallback restarts from the first row and closes pyarrow's reader."""
+    if resize_video.pa is None:
+        pytest.skip("pyarrow is not installed")
+    csv_path, metadata_path = yolo_csv
+    monkeypatch.setattr(resize_video, "CSV_BLOCK_SIZE", 4096)
+    open_csv = resize_video.pacsv.open_csv
+    readers = []
+
+    class FailingReader:
+        """Fails after the first batch of the conversion pass."""
+
+        def __init__(self, *args, **kwargs):
+            self.reader = open_csv(*args, **kwargs)
+            self.fail = len(readers) == 1
+            self.closed = False
+            readers.append(self)
+
+        @property
+        def schema(self):
+            return self.reader.schema
+
+        def __iter__(self):
+            for i, batch in enumerate(self.reader):
+                if self.fail and i == 1:
+                    raise resize_video.pa.ArrowInvalid("column changed type")
+                yield batch
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.closed = True
+            self.reader.close()
+
+    monkeypatch.setattr(resize_video.pacsv, "open_csv", FailingReader)
+
+    output_path = tmp_path / "original.csv"
+    assert resize_video.convert_mediapipe_coordinates(
+        str(csv_path), str(metadata_path), str(output_path), "yolo"
+    )
+
+    assert len(readers) == 2 and all(reader.closed for reader in readers)
+    metadata = json.loads(metadata_path.read_text())
+    expected = resize_video.convert_coordinates_by_format(
+        pd.read_csv(csv_path), metadata, "yolo"
+    ).to_csv(index=False)
+    output_lines = output_path.read_text().splitlines()
+    expected_lines = expected.splitlines()
+    assert len(output_lines) == len(expected_lines)
+    mismatches = [
+        (line, wanted)
+        for line, wanted in zip(output_lines, expected_lines)
+        if line != wanted
+    ]
+    assert not mismatches, f"{len(mismatches)} rows differ, first: {mismatches[0]}"
@@ -10,83 +10,101 @@ Version: 2024-08-16 12:00:00
 Changelog:
 - 2024-08-16: Added `process_videos_gui` functionality for video processing. This update integrates the video processing GUI into the package, allowing users to define and concatenate video segments through a user-friendly interface.
 - 2024-10-09: Added `linear_interpolation_split` functionality for applying linear interpolation and data splitting. This update provides enhancing data_processingta cleaning and manipulation features.
+- 2026-10-15: Public names are now resolved lazily through a module-level `__getattr__` (PEP 562), so `import vaila` no longer loads every submodule and its numpy/opencv/matplotlib dependencies up front.
 
 Author: Prof. Paulo Santiago
 """
 
-from .ellipse import plot_ellipse_pca, plot_cop_pathway_with_ellipse
-from .data_processing import read_cluster_csv, read_mocap_csv
-from .filter_utils import butter_filter
-from .plotting import plot_orthonormal_bases
-from .rotation import rotdata, createortbase, calcmatrot, rotmat2euler
-from .readcsv import (
-    headersidx,
-    reshapedata,
-    select_file,
-    select_headers_gui,
-    get_csv_headers,
-    show_csv,
-)
-from .rearrange_data import rearrange_data_in_directory
-from .readc3d_export import convert_c3d_to_csv
-from .modifylabref import modify_lab_coords, get_labcoord_angles
-from .batchcut import batch_cut_videos
-from .drawboxe import run_drawboxe
-from . import cluster_analysis
-from . import imu_analysis
-from . import markerless_3D_analysis
-from . import mocap_analysis
-from . import forceplate_analysis
-from .filemanager import (
-    import_file,
-    export_file,
-    copy_file,
-    move_file,
-    remove_file,
-    rename_files,
-    tree_file,
-    find_file,
-    transfer_file,
-)
-from .showc3d import show_c3d
-from .syncvid import sync_videos
-from .compress_videos_h264 import compress_videos_h264_gui
-from .compress_videos_h265 import compress_videos_h265_gui
-from .extractpng import VideoProcessor
-from .readcsv_export import create_c3d_from_csv, convert_csv_to_c3d
-from .emg_labiocom import run_emg_gui
-from .vailaplot2d import run_plot_2d as plot_2d
-from .vailaplot3d import run_plot_3d as plot_3d
-from .mergestack import merge_csv_files, stack_csv_files
-from .videoprocessor import process_videos_gui
-from .sync_flash import get_median_brightness
-from .spectral_features import (
-    total_power,
-    power_frequency_50,
-    power_frequency_95,
-    power_mode,
-    centroid_frequency,
-    frequency_dispersion,
-    energy_content_below_0_5,
-    energy_content_0_5_2,
-    energy_content_above_2,
-    frequency_quotient,
-)
+import importlib
 
-__all__ = [
+# Public name -> (submodule, attribute). An attribute of None re-exports the
+# submodule itself. Nothing is imported until the name is first accessed, so
+# `import vaila` stays cheap for CLI tools that only need a single module.
+_LAZY = {
+    "plot_ellipse_pca": ("ellipse", "plot_ellipse_pca"),
+    "plot_cop_pathway_with_ellipse": ("ellipse", "plot_cop_pathway_with_ellipse"),
+    "read_cluster_csv": ("data_processing", "read_cluster_csv"),
+    "read_mocap_csv": ("data_processing", "read_mocap_csv"),
+    "read_mocap_xyz": ("data_processing", "read_mocap_xyz"),
+    "butter_filter": ("filter_utils", "butter_filter"),
+    "plot_orthonormal_bases": ("plotting", "plot_orthonormal_bases"),
+    "rotdata": ("rotation", "rotdata"),
+    "createortbase": ("rotation", "createortbase"),
+    "calcmatrot": ("rotation", "calcmatrot"),
+    "rotmat2euler": ("rotation", "rotmat2euler"),
+    "rotmat2euler_batch": ("rotation", "rotmat2euler_batch"),
+    "rotate_markers": ("rotation", "rotate_markers"),
+    "headersidx": ("readcsv", "headersidx"),
+    "reshapedata": ("readcsv", "reshapedata"),
+    "select_file": ("readcsv", "select_file"),
+    "select_headers_gui": ("readcsv", "select_headers_gui"),
+    "get_csv_headers": ("readcsv", "get_csv_headers"),
+    "show_csv": ("readcsv", "show_csv"),
+    "rearrange_data_in_directory": ("rearrange_data", "rearrange_data_in_directory"),
+    "rec2d_batch": ("rec2d", "rec2d_batch"),
+    "convert_c3d_to_csv": ("readc3d_export", "convert_c3d_to_csv"),
+    "modify_lab_coords": ("modifylabref", "modify_lab_coords"),
+    "get_labcoord_angles": ("modifylabref", "get_labcoord_angles"),
+    "batch_cut_videos": ("batchcut", "batch_cut_videos"),
+    "run_drawboxe": ("drawboxe", "run_drawboxe"),
+    "cluster_analysis": ("cluster_analysis", None),
+    "imu_analysis": ("imu_analysis", None),
+    "markerless_3D_analysis": ("markerless_3D_analysis", None),
+    "mocap_analysis": ("mocap_analysis", None),
+    "forceplate_analysis": ("forceplate_analysis", None),
+    "import_file": ("filemanager", "import_file"),
+    "export_file": ("filemanager", "export_file"),
+    "copy_file": ("filemanager", "copy_file"),
+    "move_file": ("filemanager", "move_file"),
+    "remove_file": ("filemanager", "remove_file"),
+    "rename_files": ("filemanager", "rename_files"),
+    "tree_file": ("filemanager", "tree_file"),
+    "find_file": ("filemanager", "find_file"),
+    "transfer_file": ("filemanager", "transfer_file"),
+    "show_c3d": ("showc3d", "show_c3d"),
+    "sync_videos": ("syncvid", "sync_videos"),
+    "compress_videos_h264_gui": ("compress_videos_h264", "compress_videos_h264_gui"),
+    "compress_videos_h265_gui": ("compress_videos_h265", "compress_videos_h265_gui"),
+    "VideoProcessor": ("extractpng", "VideoProcessor"),
+    "create_c3d_from_csv": ("readcsv_export", "create_c3d_from_csv"),
+    "convert_csv_to_c3d": ("readcsv_export", "convert_csv_to_c3d"),
+    "run_emg_gui": ("emg_labiocom", "run_emg_gui"),
+    "plot_2d": ("vailaplot2d", "run_plot_2d"),
+    "plot_3d": ("vailaplot3d", "run_plot_3d"),
+    "merge_csv_files": ("mergestack", "merge_csv_files"),
+    "stack_csv_files": ("mergestack", "stack_csv_files"),
+    "process_videos_gui": ("videoprocessor", "process_videos_gui"),
+    "get_median_brightness": ("sync_flash", "get_median_brightness"),
+    "total_power": ("spectral_features", "total_power"),
+    "power_frequency_50": ("spectral_features", "power_frequency_50"),
+    "power_frequency_95": ("spectral_features", "power_frequency_95"),
+    "power_mode": ("spectral_features", "power_mode"),
+    "centroid_frequency": ("spectral_features", "centroid_frequency"),
+    "frequency_dispersion": ("spectral_features", "frequency_dispersion"),
+    "energy_content_below_0_5": ("spectral_features", "energy_content_below_0_5"),
+    "energy_content_0_5_2": ("spectral_features", "energy_content_0_5_2"),
+    "energy_content_above_2": ("spectral_features", "energy_content_above_2"),
+    "frequency_quotient": ("spectral_features", "frequency_quotient"),
+}
+
+__all__ = (
     "plot_ellipse_pca",
     "plot_cop_pathway_with_ellipse",
     "read_cluster_csv",
     "read_mocap_csv",
+    "read_mocap_xyz",
     "butter_filter",
     "plot_orthonormal_bases",
     "rotdata",
     "createortbase",
     "calcmatrot",
     "rotmat2euler",
+    "rotmat2euler_batch",
+    "rotate_markers",
     "headersidx",
     "reshapedata",
     "rearrange_data_in_directory",
+    "rec2d_batch",
     "batch_cut_videos",
     "run_drawboxe",
     "compress_videos_h264_gui",
@@ -134,4 +152,22 @@ __all__ = [
     "energy_content_0_5_2",
     "energy_content_above_2",
     "frequency_quotient",
-]
+)
+
+_DIR = sorted(set(__all__) | set(_LAZY))
+
+
+def __getattr__(name):
+    """Resolve a public name on first access (PEP 562) and cache it."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module("." + module_name, __name__)
+    obj = module if attr is None else getattr(module, attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return _DIR
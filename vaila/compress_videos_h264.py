@@ -91,6 +91,7 @@ import os
 import subprocess
 import platform
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
@@ -100,6 +101,9 @@ from rich import print
 success_count = 0
 failure_count = 0
 
+# Threads given to each CPU encode when several videos are compressed at once
+ENCODER_THREADS = 4
+
 
 def is_nvidia_gpu_available():
     """Check if an NVIDIA GPU is available in the system."""
@@ -146,7 +150,132 @@ def create_temp_file_with_videos(video_files):
     return temp.name
 
 
-def run_compress_videos_h264(input_list, output_dir, preset, crf, resolution, use_gpu):
+def compress_video_h264(
+    video_path, output_dir, preset, crf, resolution, use_gpu, threads=None, tune=None
+):
+    """Compress a single video file to H.264. Returns True on success."""
+    output_path = os.path.join(
+        output_dir, os.path.splitext(os.path.basename(video_path))[0] + "_h264.mp4"
+    )
+
+    try:
+        # Get original video resolution for debug
+        try:
+            cmd_probe = [
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "v:0",
+                "-show_entries",
+                "stream=width,height",
+                "-of",
+                "csv=s=x:p=0",
+                video_path,
+            ]
+            original_resolution = (
+                subprocess.check_output(cmd_probe).decode().strip()
+            )
+            print(f"[DEBUG] Original video resolution: {original_resolution}")
+        except Exception as e:
+            print(f"[DEBUG] Error getting original resolution: {str(e)}")
+            original_resolution = "unknown"
+
+        # Base command; -nostdin keeps parallel ffmpeg processes off the console
+        cmd = ["ffmpeg", "-nostdin", "-y", "-i", video_path]
+
+        # Add scale filter if resolution is not original
+        if resolution != "original":
+            scale_filter = f"scale={resolution.replace('x', ':')}:force_original_aspect_ratio=decrease,pad={resolution.replace('x', ':')}:(ow-iw)/2:(oh-ih)/2"
+            print(f"[DEBUG] Applying scale filter: {scale_filter}")
+            cmd.extend(["-vf", scale_filter])
+        else:
+            print("[DEBUG] Keeping original resolution (no scale filter)")
+
+        # Add encoding settings based on GPU availability
+        if use_gpu:
+            cmd.extend(
+                [
+                    "-c:v",
+                    "h264_nvenc",
+                    "-preset",
+                    preset,
+                    "-b:v",
+                    "5M",
+                    "-maxrate",
+                    "5M",
+                    "-bufsize",
+                    "10M",
+                ]
+            )
+        else:
+            cmd.extend(
+                [
+                    "-c:v",
+                    "libx264",
+                    "-preset",
+                    preset,
+                    "-crf",
+                    str(crf),
+                ]
+            )
+            if tune:
+                cmd.extend(["-tune", tune])
+
+        # Limit encoder threads so that parallel encodes share the CPU cores
+        if threads:
+            cmd.extend(["-threads", str(threads)])
+
+        # Add audio settings and output path
+        cmd.extend(["-c:a", "copy", output_path])
+
+        print("\n[DEBUG] Complete ffmpeg command:")
+        print(" ".join(cmd))
+
+        print(f"\nProcessing: {os.path.basename(video_path)}")
+        subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
+
+        # Verify output video resolution
+        try:
+            cmd_check = [
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "v:0",
+                "-show_entries",
+                "stream=width,height",
+                "-of",
+                "csv=s=x:p=0",
+                output_path,
+            ]
+            output_resolution = subprocess.check_output(cmd_check).decode().strip()
+            print(f"[DEBUG] Output video resolution: {output_resolution}")
+        except Exception as e:
+            print(f"[DEBUG] Error checking output resolution: {str(e)}")
+
+        print(f"Successfully compressed: {os.path.basename(video_path)}")
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"Failed to compress: {os.path.basename(video_path)}")
+        print(f"Error: {str(e)}")
+        print(
+            f"[DEBUG] ffmpeg error output: {e.stderr if hasattr(e, 'stderr') else 'Not available'}"
+        )
+        return False
+
+
+def run_compress_videos_h264(
+    input_list,
+    output_dir,
+    preset,
+    crf,
+    resolution,
+    use_gpu,
+    max_workers=None,
+    tune=None,
+):
     """Run the actual compression."""
     global success_count, failure_count
     success_count = 0
@@ -155,124 +284,54 @@ def run_compress_videos_h264(input_list, output_dir, preset, crf, resolution, us
     print("\n[DEBUG] Compression Parameters:")
     print(f"[DEBUG] - Preset: {preset}")
     print(f"[DEBUG] - CRF: {crf}")
+    print(f"[DEBUG] - Tune: {tune}")
     print(f"[DEBUG] - Resolution: {resolution}")
     print(f"[DEBUG] - Use GPU: {use_gpu}")
+    print(f"[DEBUG] - Max workers: {max_workers}")
 
     os.makedirs(output_dir, exist_ok=True)
 
     with open(input_list, "r") as f:
         video_paths = [line.strip() for line in f]
 
-    for video_path in video_paths:
-        output_path = os.path.join(
-            output_dir, os.path.splitext(os.path.basename(video_path))[0] + "_h264.mp4"
-        )
-
-        try:
-            # Get original video resolution for debug
-            try:
-                cmd_probe = [
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-select_streams",
-                    "v:0",
-                    "-show_entries",
-                    "stream=width,height",
-                    "-of",
-                    "csv=s=x:p=0",
-                    video_path,
-                ]
-                original_resolution = (
-                    subprocess.check_output(cmd_probe).decode().strip()
-                )
-                print(f"[DEBUG] Original video resolution: {original_resolution}")
-            except Exception as e:
-                print(f"[DEBUG] Error getting original resolution: {str(e)}")
-                original_resolution = "unknown"
-
-            # Base command
-            cmd = ["ffmpeg", "-y", "-i", video_path]
-
-            # Add scale filter if resolution is not original
-            if resolution != "original":
-                scale_filter = f"scale={resolution.replace('x', ':')}:force_original_aspect_ratio=decrease,pad={resolution.replace('x', ':')}:(ow-iw)/2:(oh-ih)/2"
-                print(f"[DEBUG] Applying scale filter: {scale_filter}")
-                cmd.extend(["-vf", scale_filter])
-            else:
-                print("[DEBUG] Keeping original resolution (no scale filter)")
-
-            # Add encoding settings based on GPU availability
-            if use_gpu:
-                cmd.extend(
-                    [
-                        "-c:v",
-                        "h264_nvenc",
-                        "-preset",
-                        preset,
-                        "-b:v",
-                        "5M",
-                        "-maxrate",
-                        "5M",
-                        "-bufsize",
-                        "10M",
-                    ]
-                )
-            else:
-                cmd.extend(
-                    [
-                        "-c:v",
-                        "libx264",
-                        "-preset",
-                        preset,
-                        "-crf",
-                        str(crf),
-                    ]
-                )
-
-            # Add audio settings and output path
-            cmd.extend(["-c:a", "copy", output_path])
-
-            print("\n[DEBUG] Complete ffmpeg command:")
-            print(" ".join(cmd))
-
-            print(f"\nProcessing: {os.path.basename(video_path)}")
-            subprocess.run(cmd, check=True)
-
-            # Verify output video resolution
-            try:
-                cmd_check = [
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-select_streams",
-                    "v:0",
-                    "-show_entries",
-                    "stream=width,height",
-                    "-of",
-                    "csv=s=x:p=0",
-                    output_path,
-                ]
-                output_resolution = subprocess.check_output(cmd_check).decode().strip()
-                print(f"[DEBUG] Output video resolution: {output_resolution}")
-            except Exception as e:
-                print(f"[DEBUG] Error checking output resolution: {str(e)}")
-
-            success_count += 1
-            print(f"Successfully compressed: {os.path.basename(video_path)}")
-
-        except subprocess.CalledProcessError as e:
-            failure_count += 1
-            print(f"Failed to compress: {os.path.basename(video_path)}")
-            print(f"Error: {str(e)}")
-            print(
-                f"[DEBUG] ffmpeg error output: {e.stderr if hasattr(e, 'stderr') else 'Not available'}"
+    # ffmpeg does the encoding in its own process, so a thread pool is enough to
+    # keep several encodes running at once. Each CPU encode gets an equal share
+    # of the cores through -threads; NVENC sessions are limited on consumer
+    # GPUs, so GPU encodes run one at a time unless asked otherwise.
+    cpu_count = os.cpu_count() or 1
+    if max_workers is None:
+        max_workers = 1 if use_gpu else max(1, cpu_count // ENCODER_THREADS)
+    max_workers = max(1, min(max_workers, len(video_paths)))
+    threads = None if use_gpu or max_workers == 1 else max(1, cpu_count // max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                compress_video_h264,
+                video_path,
+                output_dir,
+                preset,
+                crf,
+                resolution,
+                use_gpu,
+                threads,
+                tune,
             )
+            for video_path in video_paths
+        ]
+        for future in as_completed(futures):
+            if future.result():
+                success_count += 1
+            else:
+                failure_count += 1
 
 
-def get_compression_parameters():
+def get_compression_parameters(preset="medium", crf=23):
     """
     Create a single dialog window where user selects options by entering numbers.
+
+    The preset and crf arguments are the values pre-filled in the dialog. An
+    unknown preset is replaced by "medium".
     """
     # Create a dictionary to store parameters
     params = {}
@@ -299,6 +358,11 @@ def get_compression_parameters():
         "640x360",
     ]
 
+    # Fall back to the default preset rather than failing on an unknown one
+    if preset not in preset_options:
+        print(f"Unknown preset '{preset}', using 'medium' instead")
+        preset = "medium"
+
     # Create dialog window
     dialog = tk.Toplevel()
     dialog.title("Video Compression Settings")
@@ -317,7 +381,7 @@ def get_compression_parameters():
     tk.Label(
         main_frame, text="Preset (enter number):", font=("Arial", 10, "bold")
     ).grid(row=1, column=0, sticky="w", pady=5)
-    preset_var = tk.StringVar(value="5")  # Default to medium (index 5)
+    preset_var = tk.StringVar(value=str(preset_options.index(preset) + 1))
     preset_entry = tk.Entry(main_frame, textvariable=preset_var, width=5)
     preset_entry.grid(row=1, column=1, sticky="w", pady=5)
 
@@ -338,7 +402,7 @@ def get_compression_parameters():
     tk.Label(main_frame, text="CRF Value (0-51):", font=("Arial", 10, "bold")).grid(
         row=3, column=0, sticky="w", pady=5
     )
-    crf_var = tk.StringVar(value="23")
+    crf_var = tk.StringVar(value=str(crf))
     crf_entry = tk.Entry(main_frame, textvariable=crf_var, width=5)
     crf_entry.grid(row=3, column=1, sticky="w", pady=5)
 
@@ -563,14 +627,32 @@ GPU ACCELERATION:
     return params if params else None
 
 
-def compress_videos_h264_gui():
-    """Main function to run the GUI and compression process."""
+def compress_videos_h264_gui(
+    parallel=True, max_workers=None, crf=23, preset="medium", tune=None
+):
+    """
+    Main function to run the GUI and compression process.
+
+    Args:
+        parallel (bool): Compress several videos at the same time. When False,
+            videos are encoded one after the other.
+        max_workers (int, optional): Number of simultaneous encodes. Defaults to
+            the number of CPU cores divided by ENCODER_THREADS.
+        crf (int): Constant Rate Factor pre-filled in the settings dialog.
+            Constant quality (CRF) is preferred over two-pass bitrate targets
+            for archival; lower values give better quality and larger files.
+        preset (str): libx264 preset pre-filled in the settings dialog. Slower
+            presets compress better but can take several times longer to
+            encode, while "veryfast" is a good choice for large batches.
+        tune (str, optional): Value passed to -tune for CPU encodes
+            (e.g. "film", "animation", "grain", "zerolatency").
+    """
     print(f"Running script: {os.path.basename(__file__)}")
     print(f"Script directory: {os.path.dirname(os.path.abspath(__file__))}")
     print("Starting compress_videos_h264_gui...")
 
     # Get compression parameters through dialog
-    compression_config = get_compression_parameters()
+    compression_config = get_compression_parameters(preset=preset, crf=crf)
 
     # Check if user cancelled
     if not compression_config:
@@ -619,6 +701,8 @@ def compress_videos_h264_gui():
         crf=compression_config["crf"],
         resolution=compression_config["resolution"],
         use_gpu=use_gpu,
+        max_workers=max_workers if parallel else 1,
+        tune=tune,
     )
 
     # Remove temporary file
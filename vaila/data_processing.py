@@ -78,3 +78,57 @@ def read_mocap_csv(file_path):
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
+
+
+def read_mocap_xyz(file_path, dtype=np.float32):
+    """
+    Reads a mocap CSV file into a contiguous marker array.
+
+    Columns are grouped into markers by their `_X`, `_Y`, `_Z` suffixes, so the
+    coordinates of each frame are stored next to each other. This layout can be
+    passed straight to `rotation.rotate_markers` and sliced per marker
+    (`xyz[:, m]`) for `createortbase`.
+
+    Parameters:
+    file_path (str): The path to the CSV file.
+    dtype (np.dtype): The dtype of the returned coordinates. float32 halves the
+        memory traffic of whole-trial computations.
+
+    Returns:
+    dict: "xyz" (np.ndarray of shape (num_frames, num_markers, 3)), "names"
+        (list of marker names) and "time" (np.ndarray, or None if the file has
+        no time column), or None if the file could not be read.
+    """
+    try:
+        header_lines = determine_header_lines_mocap(file_path)
+        data = pd.read_csv(file_path, header=header_lines)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return None
+
+    columns = [str(col) for col in data.columns]
+    upper = [col.upper() for col in columns]
+    names = []
+    x_cols = []
+    for col, col_upper in zip(columns, upper):
+        if not col_upper.endswith("_X"):
+            continue
+        name = col[:-2]
+        y_col, z_col = f"{name}_Y".upper(), f"{name}_Z".upper()
+        if y_col in upper and z_col in upper:
+            names.append(name)
+            x_cols.append(
+                [upper.index(col_upper), upper.index(y_col), upper.index(z_col)]
+            )
+
+    flat_cols = [idx for triplet in x_cols for idx in triplet]
+    values = data.iloc[:, flat_cols].to_numpy(dtype=dtype)
+    xyz = np.ascontiguousarray(values).reshape(len(data), len(names), 3)
+
+    time = None
+    for col, col_upper in zip(columns, upper):
+        if col_upper == "TIME":
+            time = data[col].to_numpy(dtype=np.float64)
+            break
+
+    return {"xyz": xyz, "names": names, "time": time}
@@ -114,7 +114,6 @@ Changelog:
 
 import os
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime
 from tkinter import messagebox, filedialog, Tk, simpledialog
 
@@ -223,6 +222,7 @@ def polynomial_fit(x, y, poly_deg=2):
 
 
 def emg_analysis(emg_file, fs, start_index, end_index, no_plot, selected_path):
+    import matplotlib.pyplot as plt
     from scipy.signal import welch
 
     emg_signal = np.genfromtxt(
@@ -432,6 +432,8 @@ def emg_analysis(emg_file, fs, start_index, end_index, no_plot, selected_path):
 
 
 def plot_initial_emg(emg_file, fs):
+    import matplotlib.pyplot as plt
+
     emg_signal = np.genfromtxt(
         emg_file, delimiter=",", skip_header=1, filling_values=0.0
     )
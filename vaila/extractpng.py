@@ -63,8 +63,8 @@ import time
 from tkinter import filedialog, messagebox, simpledialog, Tk, Toplevel, Label, Button
 from rich import print
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import cv2
 
 
 class VideoProcessor:
@@ -104,103 +104,89 @@ class VideoProcessor:
                 )
             ]
 
-            for item in video_files:
-                video_path = os.path.join(src, item)
-                video_name = os.path.splitext(item)[0]
-                output_dir = os.path.join(dest_main_dir, f"{video_name}_png")
-                os.makedirs(output_dir, exist_ok=True)
-                output_pattern = os.path.join(output_dir, self.pattern)
+            # Each ffmpeg process already uses several threads, so only a few
+            # videos are extracted at the same time
+            max_workers = max(1, min(len(video_files), (os.cpu_count() or 1) // 4))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(
+                    executor.map(
+                        lambda item: self.extract_png_from_video(
+                            src, item, dest_main_dir, timestamp
+                        ),
+                        video_files,
+                    )
+                )
 
-                # Get video dimensions and FPS
-                width, height, fps = self.get_video_info(video_path)
+            self.show_completion_message("PNG extraction completed successfully.")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error extracting PNG frames: {e}")
 
-                # Updated command for better HEVC decoding and PNG compatibility
-                command = [
-                    "ffmpeg",
-                    "-i",
-                    video_path,
-                    "-vf",
-                    f"scale={width}:{height}:flags=lanczos",  # Removed format=rgb24
-                    "-q:v",
-                    "1",
-                    "-fps_mode",
-                    "passthrough",
-                    "-hwaccel",
-                    "auto",
-                    "-c:v",
-                    "hevc_cuvid",
-                    "-drop_second_field",
-                    "1",
-                    "-sws_flags",
-                    "bicubic",
-                    "-pix_fmt",
-                    "rgb24",  # Kept for correct color
-                    "-f",
-                    "image2",  # Forces image format
-                    "-compression_level",
-                    "6",  # PNG compression level (0-9)
-                    output_pattern,
-                ]
+    def extract_png_from_video(self, src, item, dest_main_dir, timestamp):
+        video_path = os.path.join(src, item)
+        video_name = os.path.splitext(item)[0]
+        output_dir = os.path.join(dest_main_dir, f"{video_name}_png")
+        os.makedirs(output_dir, exist_ok=True)
+        output_pattern = os.path.join(output_dir, self.pattern)
+
+        # Get video dimensions and FPS
+        width, height, fps = self.get_video_info(video_path)
+
+        # Frames are written at the source resolution, so no scale filter is
+        # needed. -hwaccel is an input option and must come before -i.
+        output_options = [
+            "-fps_mode",
+            "passthrough",
+            "-pix_fmt",
+            "rgb24",  # Kept for correct color
+            "-f",
+            "image2",  # Forces image format
+            "-compression_level",
+            "6",  # PNG compression level (0-9)
+            output_pattern,
+        ]
+        # -nostdin keeps parallel ffmpeg processes from competing for the console
+        command = [
+            "ffmpeg",
+            "-nostdin",
+            "-y",
+            "-hwaccel",
+            "auto",
+            "-i",
+            video_path,
+        ] + output_options
 
-                try:
-                    # Try first with hardware acceleration
-                    try:
-                        print(f"\nProcessing {item} with hardware acceleration...")
-                        subprocess.run(command, check=True)
-
-                    except subprocess.CalledProcessError:
-                        print(
-                            "\nHardware acceleration failed, trying software decoder..."
-                        )
-
-                        # Remove hardware acceleration to try software decoder
-                        command = [
-                            "ffmpeg",
-                            "-i",
-                            video_path,
-                            "-vf",
-                            f"scale={width}:{height}:flags=lanczos",
-                            "-q:v",
-                            "1",
-                            "-fps_mode",
-                            "passthrough",
-                            "-sws_flags",
-                            "bicubic",
-                            "-pix_fmt",
-                            "rgb24",
-                            "-f",
-                            "image2",
-                            "-compression_level",
-                            "6",
-                            output_pattern,
-                        ]
-
-                        subprocess.run(command, check=True)
-
-                    print(f"\n\nChecking frames in {output_dir}...")
-                    total_frames = len(
-                        [f for f in os.listdir(output_dir) if f.endswith(".png")]
-                    )
-                    print(f"Total frames extracted: {total_frames}")
+        try:
+            # Try first with hardware acceleration
+            try:
+                print(f"\nProcessing {item} with hardware acceleration...")
+                subprocess.run(command, check=True)
 
-                    # Save basic video information
-                    with open(os.path.join(output_dir, "video_info.txt"), "w") as f:
-                        f.write(f"Original video: {item}\n")
-                        f.write(f"FPS: {fps}\n")
-                        f.write(f"Resolution: {width}x{height}\n")
-                        f.write(f"Total frames: {total_frames}\n")
-                        f.write(f"Extraction timestamp: {timestamp}\n")
+            except subprocess.CalledProcessError:
+                print("\nHardware acceleration failed, trying software decoder...")
 
-                    print(f"Successfully extracted frames from {item}")
-                    print(f"Resolution: {width}x{height}, FPS: {fps}")
+                # Remove hardware acceleration to try software decoder
+                command = ["ffmpeg", "-nostdin", "-y", "-i", video_path] + output_options
 
-                except Exception as e:
-                    print(f"Error processing {item}: {str(e)}")
-                    raise
+                subprocess.run(command, check=True)
+
+            print(f"\n\nChecking frames in {output_dir}...")
+            total_frames = len([f for f in os.listdir(output_dir) if f.endswith(".png")])
+            print(f"Total frames extracted: {total_frames}")
+
+            # Save basic video information
+            with open(os.path.join(output_dir, "video_info.txt"), "w") as f:
+                f.write(f"Original video: {item}\n")
+                f.write(f"FPS: {fps}\n")
+                f.write(f"Resolution: {width}x{height}\n")
+                f.write(f"Total frames: {total_frames}\n")
+                f.write(f"Extraction timestamp: {timestamp}\n")
+
+            print(f"Successfully extracted frames from {item}")
+            print(f"Resolution: {width}x{height}, FPS: {fps}")
 
-            self.show_completion_message("PNG extraction completed successfully.")
         except Exception as e:
-            messagebox.showerror("Error", f"Error extracting PNG frames: {e}")
+            print(f"Error processing {item}: {str(e)}")
+            raise
 
     def extract_select_frames_from_video(self):
         print("Starting extraction of specific frames from video...")
@@ -371,6 +357,8 @@ class VideoProcessor:
             return False
 
     def get_fps(self, video_path):
+        import cv2
+
         cap = cv2.VideoCapture(video_path)
         fps = cap.get(cv2.CAP_PROP_FPS)
         cap.release()
@@ -26,8 +26,6 @@ New Features in This Version:
 
 import os
 from rich import print
-import pygame
-import cv2
 import pandas as pd
 import numpy as np
 from tkinter import Tk, filedialog, messagebox
@@ -52,6 +50,9 @@ def get_color_for_id(marker_id):
 
 
 def play_video_with_controls(video_path, coordinates=None):
+    import pygame
+    import cv2
+
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         print("Error opening video file.")
@@ -1581,6 +1582,8 @@ def run_getpixelvideo():
         "Do you want to load existing keypoints from a saved file?",
     )
 
+    import cv2
+
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         print("Error opening video file.")
@@ -52,13 +52,16 @@ from io import StringIO
 from datetime import datetime
 from tkinter import Tk, filedialog
 
+WHITESPACE_RE = re.compile(r"[\s]+")
+NON_WORD_RE = re.compile(r"[^\w]")
+
 
 def clean_header(header):
     """Sanitize the header to handle specific units and replace problematic characters."""
     header = header.replace("mm/s²", "mm_s2")
     header = header.replace("deg/s", "deg_s")
-    header = re.sub(r"[\s]+", "_", header)
-    header = re.sub(r"[^\w]", "", header)
+    header = WHITESPACE_RE.sub("_", header)
+    header = NON_WORD_RE.sub("", header)
     return header
 
 
@@ -1,14 +1,15 @@
 """
 mergestack.py
-Version: 2025-02-28 15:30:00
+Version: 2026-10-15 10:00:00
 Author: Paulo R. P. Santiago
-Version: 0.0.3
+Version: 0.0.4
 
 Dependencies:
 - Python 3.12.9
 - pandas
 - tkinter
 - os
+- pyarrow (optional, multithreaded CSV parsing)
 
 Contact:
 --------
@@ -19,6 +20,9 @@ Version history:
 - v0.0.1 (2025-02-28): Initial version. Merge and stack CSV files.
 - v0.0.2 (2025-02-28): Added function to select file.
 - v0.0.3 (2025-02-28): Added function to stack CSV files.
+- v0.0.4 (2026-10-15): Parse CSV files with the pyarrow engine when pyarrow is installed.
+  Files with duplicate or empty header names are still read with pandas' C parser,
+  so their columns get the same names with or without pyarrow.
 
 Usage:
 ------
@@ -72,6 +76,24 @@ import pandas as pd
 from tkinter import filedialog, messagebox
 import os
 
+# Use Arrow's multithreaded CSV parser when available, pandas' C parser otherwise
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+
+def read_csv(file_path):
+    if CSV_ENGINE == "pyarrow":
+        # pyarrow keeps duplicate and empty header names as they are, while
+        # pandas renames them (a.1, Unnamed: 2), so leave those files to pandas
+        header = pd.read_csv(file_path, header=None, nrows=1, dtype=str).iloc[0]
+        if header.notna().all() and header.is_unique:
+            return pd.read_csv(file_path, engine="pyarrow")
+    return pd.read_csv(file_path, engine="c")
+
 
 def select_file(prompt):
     return filedialog.askopenfilename(title=prompt, filetypes=[("CSV files", "*.csv")])
@@ -83,9 +105,9 @@ def merge_csv_files(base_file, merge_file, save_path, insert_position=None):
     save_file_name = os.path.basename(save_path)
 
     print(f"Loading base file: {base_file_name}")
-    base_df = pd.read_csv(base_file)
+    base_df = read_csv(base_file)
     print(f"Loading merge file: {merge_file_name}")
-    merge_df = pd.read_csv(merge_file)
+    merge_df = read_csv(merge_file)
 
     if insert_position is None or insert_position > len(base_df.columns):
         insert_position = len(base_df.columns) + 1
@@ -116,9 +138,9 @@ def stack_csv_files(base_file, stack_file, save_path, position="end"):
     save_file_name = os.path.basename(save_path)
 
     print(f"Loading base file: {base_file_name}")
-    base_df = pd.read_csv(base_file)
+    base_df = read_csv(base_file)
     print(f"Loading stack file: {stack_file_name}")
-    stack_df = pd.read_csv(stack_file)
+    stack_df = read_csv(stack_file)
 
     # Remove header of stack file
     stack_df.columns = base_df.columns
@@ -4,14 +4,13 @@ numberframes.py
 Description:
 This script allows users to analyze video files within a selected directory and extract metadata such as frame count, frame rate (FPS), resolution, codec, and duration. The script generates a summary of this information, displays it in a user-friendly graphical interface, and saves the metadata to text files. The "basic" file contains essential metadata, while the "full" file includes all possible metadata extracted using `ffprobe`.
 
-Version: 0.3
+Version: 0.4
 Created: 25 April 2024
-Last Updated: 19 April 2025
+Last Updated: 15 October 2026
 Author: Prof. Paulo R. P. Santiago
 
 Dependencies:
 - Python 3.x
-- OpenCV
 - Tkinter
 - FFmpeg/FFprobe
 
@@ -23,10 +22,10 @@ Usage:
 
 import os
 from rich import print
-import cv2
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 
 
@@ -82,16 +81,16 @@ def get_video_info(video_path):
         width = int(resolution[0])
         height = int(resolution[1])
 
-        # 3. Obter número de frames
+        # 3. Obter número de frames (conta pacotes do container, sem decodificar)
         frames_cmd = [
             "ffprobe",
             "-v",
             "error",
             "-select_streams",
             "v:0",
-            "-count_frames",
+            "-count_packets",
             "-show_entries",
-            "stream=nb_read_frames",
+            "stream=nb_read_packets",
             "-of",
             "default=noprint_wrappers=1:nokey=1",
             video_path,
@@ -283,10 +282,14 @@ def count_frames_in_videos():
             if f.lower().endswith((".mp4", ".avi", ".mov", ".mkv"))
         ]
     )
+    # ffprobe runs in its own process, so probing several files at once only
+    # needs threads waiting on the subprocesses
+    video_paths = [os.path.join(directory_path, f) for f in video_files]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        results = list(executor.map(get_video_info, video_paths))
+
     video_infos = []
-    for video_file in video_files:
-        video_path = os.path.join(directory_path, video_file)
-        video_info = get_video_info(video_path)
+    for video_file, video_info in zip(video_files, results):
         if video_info is not None:
             video_infos.append(video_info)
         else:
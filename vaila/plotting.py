@@ -67,9 +67,6 @@ This script is distributed under the GPL3 License.
 
 import numpy as np
 import os
-import matplotlib.pyplot as plt
-import plotly.graph_objs as go
-from plotly.subplots import make_subplots
 
 
 def get_colors():
@@ -127,6 +124,8 @@ def plot_orthonormal_bases_matplotlib(
         get_colors()
     )
 
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(111, projection="3d")
     ax.set_title(title)
@@ -221,6 +220,9 @@ def plot_orthonormal_bases_plotly(
 
     marker_labels = ["Marker 1", "Marker 2", "Marker 3"]
 
+    import plotly.graph_objs as go
+    from plotly.subplots import make_subplots
+
     fig = make_subplots(
         rows=1, cols=1, specs=[[{"type": "scatter3d"}]], subplot_titles=[title]
     )
@@ -364,6 +366,8 @@ def plot_orthonormal_bases_4points_matplotlib(
         get_colors()
     )
 
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(111, projection="3d")
     ax.set_title(title)
@@ -446,6 +450,9 @@ def plot_orthonormal_bases_4points_plotly(
 
     marker_labels = ["Marker 1", "Marker 2", "Marker 3", "Marker 4"]
 
+    import plotly.graph_objs as go
+    from plotly.subplots import make_subplots
+
     fig = make_subplots(
         rows=1, cols=1, specs=[[{"type": "scatter3d"}]], subplot_titles=[title]
     )
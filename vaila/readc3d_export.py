@@ -85,7 +85,6 @@ Citation:
 import os
 from rich import print
 import pandas as pd
-from ezc3d import c3d
 from datetime import datetime
 from tkinter import Tk, filedialog, messagebox
 from tqdm import tqdm
@@ -201,6 +200,9 @@ def importc3d(dat):
     print(f"Running script: {os.path.basename(__file__)}")
     print(f"Script directory: {os.path.dirname(os.path.abspath(__file__))}")
 
+    # ezc3d is imported on demand so the package import does not load it
+    from ezc3d import c3d
+
     # Load the C3D file with force platform data extraction
     datac3d = c3d(dat, extract_forceplat_data=True)
     print(f"\nProcessing file: {dat}")
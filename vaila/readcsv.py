@@ -18,8 +18,6 @@ import tkinter as tk
 from tkinter import filedialog, Toplevel, Button, Label, Listbox, Frame, messagebox
 import numpy as np
 import time
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider, Button as MplButton
 
 
 ###############################################################################
@@ -408,6 +406,9 @@ def show_csv():
     """
     Função principal para carregar o CSV, efetuar a seleção dos marcadores e plotar os dados.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.widgets import Slider
+
     root = tk.Tk()
     root.withdraw()
     file_path = select_file()
@@ -40,10 +40,12 @@ from rich import print
 import numpy as np
 import pandas as pd
 import re
-import ezc3d
 import tkinter as tk
 from tkinter import filedialog, simpledialog, messagebox
 
+# Characters not allowed in C3D marker names (applied to uppercased headers)
+INVALID_HEADER_CHARS = re.compile(r"[^A-Z0-9_]")
+
 # Dictionary for metric unit conversions with abbreviations
 CONVERSIONS = {
     "meters": (1, "m"),
@@ -107,7 +109,7 @@ def sanitize_header(header):
             empty_column_counter += 1
         else:
             # Remove any unwanted characters (anything not a letter, number, or underscore)
-            col = re.sub(r"[^A-Z0-9_]", "_", col)
+            col = INVALID_HEADER_CHARS.sub("_", col)
 
             # Remove existing suffixes "_X", "_Y", "_Z", ".X", ".Y", ".Z" if present
             if col.endswith(("_X", "_Y", "_Z")):
@@ -285,6 +287,8 @@ def create_c3d_from_csv(
     """
     print("Creating C3D from CSV...")
 
+    import ezc3d
+
     c3d = ezc3d.c3d()
     print("Initialized empty C3D object.")
 
@@ -389,6 +393,8 @@ def auto_create_c3d_from_csv(
         Exception: If there is an error writing the C3D file.
     """
     print("Creating C3D from CSV (auto mode)...")
+    import ezc3d
+
     c3d = ezc3d.c3d()
     points_df = validate_and_filter_columns(points_df)
     marker_labels = [col.rsplit("_", 1)[0] for col in points_df.columns[1::3]]
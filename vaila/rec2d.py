@@ -40,6 +40,47 @@ def rec2d(A, cc2d):
     return np.asarray(H)
 
 
+def rec2d_batch(A, cc2d):
+    """
+    Vectorized 2D DLT reconstruction for many frames and markers at once.
+
+    Solves the same 2x2 system as `rec2d` for every point in closed form, so a
+    whole trial is reconstructed without a Python loop. Points whose system is
+    singular or contains NaN come back as NaN.
+
+    Parameters:
+    A (np.ndarray): DLT parameters, shape (8,) for a single set or (F, 8) with one set per frame.
+    cc2d (np.ndarray): Pixel coordinates, shape (M, 2) or (F, M, 2).
+
+    Returns:
+    np.ndarray: Reconstructed coordinates with the same shape as `cc2d`.
+    """
+    A = np.asarray(A, dtype=float)
+    cc2d = np.asarray(cc2d, dtype=float)
+    single = cc2d.ndim == 2
+    if single:
+        cc2d = cc2d[np.newaxis]
+    if A.ndim == 1:
+        A = A[np.newaxis]
+    A = A[:, np.newaxis, :]
+
+    x = cc2d[..., 0]
+    y = cc2d[..., 1]
+    a11 = A[..., 0] - x * A[..., 6]
+    a12 = A[..., 1] - x * A[..., 7]
+    a21 = A[..., 3] - y * A[..., 6]
+    a22 = A[..., 4] - y * A[..., 7]
+    b1 = x - A[..., 2]
+    b2 = y - A[..., 5]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        det = a11 * a22 - a12 * a21
+        det = np.where(det == 0, np.nan, det)
+        H = np.stack([(a22 * b1 - a12 * b2) / det, (a11 * b2 - a21 * b1) / det], -1)
+
+    return H[0] if single else H
+
+
 def process_files_in_directory(dlt_params_df, directory):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_dir = os.path.join(directory, f"Rec2D_{timestamp}")
@@ -55,26 +96,27 @@ def process_files_in_directory(dlt_params_df, directory):
         pixel_file = os.path.join(directory, csv_file)
         pixel_coords_df = pd.read_csv(pixel_file)
 
-        rec_coords = []
-        for i, row in pixel_coords_df.iterrows():
-            frame_num = int(row["frame"])
-            if frame_num in frames:
-                A_index = np.where(frames == frame_num)[0][0]
-                A = dlt_params[A_index]
-                if not np.isnan(A).any():
-                    pixel_coords = row[1:].to_numpy().reshape(-1, 2)
-                    rec2d_coords = rec2d(A, pixel_coords)
-                    rec_coords.append((frame_num, *rec2d_coords.flatten()))
-                else:
-                    rec_coords.append(
-                        (frame_num, *[np.nan] * (pixel_coords_df.shape[1] - 1))
-                    )
-            else:
-                rec_coords.append(
-                    (frame_num, *[np.nan] * (pixel_coords_df.shape[1] - 1))
-                )
-
-        rec_coords_df = pd.DataFrame(rec_coords, columns=pixel_coords_df.columns)
+        data = pixel_coords_df.to_numpy(dtype=float)
+        frame_nums = pixel_coords_df["frame"].to_numpy().astype(int)
+        nrows = len(frame_nums)
+
+        # Match every row to the first DLT set with the same frame number
+        frame_index = {}
+        for idx, frame in enumerate(frames):
+            frame_index.setdefault(frame, idx)
+        A_index = np.array([frame_index.get(f, -1) for f in frame_nums], dtype=int)
+
+        A = np.full((nrows, dlt_params.shape[1]), np.nan)
+        matched = A_index >= 0
+        A[matched] = dlt_params[A_index[matched]]
+
+        rec2d_coords = rec2d_batch(A, data[:, 1:].reshape(nrows, -1, 2))
+        rec2d_coords[np.isnan(A).any(axis=1)] = np.nan
+
+        rec_coords_df = pd.DataFrame(
+            rec2d_coords.reshape(nrows, -1), columns=pixel_coords_df.columns[1:]
+        )
+        rec_coords_df.insert(0, pixel_coords_df.columns[0], frame_nums)
 
         output_file = os.path.join(
             output_dir, f"{os.path.splitext(csv_file)[0]}_{timestamp}.2d"
@@ -26,177 +26,662 @@ Dependencies:
 -------------
 - Python 3.12.9
 - opencv-python
+- ffmpeg (optional, H.264 encoding with hardware acceleration when available)
 - tkinter
 - pandas (for coordinates conversion)
+- numba (optional, faster conversion of very large coordinate files)
+- pyarrow (optional, multithreaded CSV parsing)
+- orjson (optional, faster metadata JSON reading and writing)
 """
 
 import os
+import shutil
+import subprocess
+import tempfile
 import cv2
 import tkinter as tk
 from tkinter import filedialog, Button, Label, Frame, StringVar, messagebox, Radiobutton
 import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import queue
+from contextlib import closing
+from dataclasses import dataclass
+from functools import partial
 from datetime import datetime
+from pathlib import Path
 import numpy as np
 import json
 import glob
+import itertools
+import re
 import pandas as pd
 from rich import print
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+# Coordinate columns end with x or y (e.g. "nose_x", "p1_Y", "x")
+COORD_COLUMN_RE = re.compile(r"[xXyY]$")
+
+# Coordinate arrays at least this large are converted with the Numba kernel
+NUMBA_MIN_SIZE = 1_000_000
+
+# Rows per chunk when streaming coordinate CSV files with pandas, and bytes
+# per block when streaming them with pyarrow
+CSV_CHUNK_SIZE = 10_000
+CSV_BLOCK_SIZE = 16 << 20
+
+# Hardware H.264 encoders tried in order, then libx264 on the CPU
+HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv")
+# Concurrent batch encodes with a hardware encoder; consumer NVENC GPUs only
+# allow a few sessions at a time
+HW_ENCODER_SESSIONS = 2
+ENCODER_OPTIONS = {
+    "h264_nvenc": ["-preset", "p4"],
+    "h264_videotoolbox": [],
+    "h264_qsv": ["-preset", "veryfast"],
+    "libx264": ["-preset", "veryfast"],
+}
+_ffmpeg_encoder = None
+
+# Default OpenCV fourcc per container, and the containers each fourcc fits
+CONTAINER_FOURCC = {
+    ".mp4": "mp4v",
+    ".mov": "mp4v",
+    ".m4v": "mp4v",
+    ".avi": "XVID",
+    ".mkv": "X264",
+}
+FOURCC_CONTAINERS = {
+    "mp4v": (".mp4", ".mov", ".m4v", ".mkv", ".avi"),
+    "avc1": (".mp4", ".mov", ".m4v", ".mkv"),
+    "X264": (".mkv", ".mp4", ".avi"),
+    "XVID": (".avi", ".mkv"),
+    "MJPG": (".avi", ".mkv", ".mov"),
+    "FFV1": (".mkv", ".avi"),
+}
+
+# Pass interpolation=INTER_PYRUP to enlarge 2x, 4x and 8x with repeated
+# cv2.pyrUp instead of cv2.resize. pyrUp puts input pixel i at output pixel
+# scale * i, so its grid is shifted against cv2.resize's by 0.5 - 0.5 / scale
+# original pixels; the shift is recorded in the metadata as "pixel_offset".
+INTER_PYRUP = "pyrup"
+PYRUP_LEVELS = {2: 1, 4: 2, 8: 3}
+
+# Resize through OpenCV's transparent API (cv2.UMat) when OpenCL is available
+try:
+    USE_UMAT = cv2.ocl.haveOpenCL()
+    if USE_UMAT:
+        cv2.ocl.setUseOpenCL(True)
+except cv2.error:
+    USE_UMAT = False
+
+# Frames buffered between the decode, resize and encode stages
+FRAME_QUEUE_SIZE = 8
+
+
+def get_ffmpeg_encoder():
+    """
+    Return the H.264 encoder used to write resized videos.
+
+    ffmpeg is probed once and the choice is cached. A hardware encoder is only
+    picked when a short test encode succeeds. Returns None when ffmpeg is not
+    installed, in which case OpenCV's XVID writer is used.
+    """
+    global _ffmpeg_encoder
+    if _ffmpeg_encoder is not None:
+        return _ffmpeg_encoder or None
+
+    if shutil.which("ffmpeg") is None:
+        _ffmpeg_encoder = ""
+        return None
+
+    _ffmpeg_encoder = "libx264"
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        for encoder in HW_ENCODERS:
+            if encoder not in result.stdout:
+                continue
+            test = subprocess.run(
+                [
+                    "ffmpeg",
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=black:s=256x256:r=1:d=1",
+                    "-c:v",
+                    encoder,
+                    "-f",
+                    "null",
+                    "-",
+                ],
+                capture_output=True,
+                timeout=10,
+            )
+            if test.returncode == 0:
+                _ffmpeg_encoder = encoder
+                break
+    except (subprocess.SubprocessError, OSError) as e:
+        print(f"Could not probe ffmpeg encoders: {e}")
+
+    print(f"Video encoder: {_ffmpeg_encoder}")
+    return _ffmpeg_encoder
+
+
+class FFmpegError(RuntimeError):
+    """Raised when an ffmpeg encode fails."""
+
+
+class FFmpegWriter:
+    """
+    Write BGR frames to an H.264 video through an ffmpeg stdin pipe.
+
+    ffmpeg's messages go to a temporary file rather than a pipe, so a verbose
+    encoder can never block the writes. They are reported in the FFmpegError
+    raised when the encode fails.
+
+    yuv420p needs an even width and height, so odd frames are padded by one
+    black pixel on the right or bottom. Pixel coordinates are unchanged; the
+    encoded size is available as `size`.
+    """
+
+    def __init__(self, output_file, fps, size, encoder):
+        width, height = size
+        self.size = (width + width % 2, height + height % 2)
+        pad = ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"] if self.size != size else []
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(fps),
+            "-i",
+            "-",
+            "-c:v",
+            encoder,
+            *ENCODER_OPTIONS[encoder],
+            *pad,
+            "-pix_fmt",
+            "yuv420p",
+            output_file,
+        ]
+        self.encoder = encoder
+        self.log = tempfile.TemporaryFile()
+        try:
+            self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=self.log)
+        except OSError as e:
+            # ffmpeg disappeared after probing, so let the caller fall back
+            self.log.close()
+            raise FFmpegError(f"Could not start ffmpeg ({encoder}): {e}") from e
+
+    def write(self, frame):
+        try:
+            # Write the frame's buffer directly instead of copying it with tobytes()
+            self.proc.stdin.write(np.ascontiguousarray(frame).data)
+        except (BrokenPipeError, ValueError):
+            # ffmpeg exited early, so report why
+            self.release()
+            raise FFmpegError(f"ffmpeg ({self.encoder}) stopped accepting frames")
+
+    def release(self):
+        if self.log.closed:
+            return
+        try:
+            self.proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self.proc.wait()
+        self.log.seek(0)
+        message = self.log.read().decode(errors="replace").strip()
+        self.log.close()
+        if returncode != 0:
+            raise FFmpegError(f"ffmpeg ({self.encoder}) encoding failed: {message}")
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """Video properties read once from an opened capture."""
+
+    width: int
+    height: int
+    fps: float
+    total_frames: int
+    duration: float
+
+    @classmethod
+    def from_capture(cls, cap):
+        """Read the properties of an opened cv2.VideoCapture."""
+        fps = float(cap.get(cv2.CAP_PROP_FPS))
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        return cls(
+            width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=fps,
+            total_frames=total_frames,
+            duration=total_frames / fps if fps > 0 else 0,
+        )
+
+
+def open_capture(video_path):
+    """
+    Open a video with OpenCV's FFmpeg backend and hardware decoding if possible.
+
+    Falls back to the default backend when the FFmpeg backend cannot open the
+    file or the OpenCV build has no hardware acceleration properties.
+    """
+    if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        cap = cv2.VideoCapture(
+            video_path,
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(video_path)
+
 
 def get_video_info(video_path):
     """Get video information using OpenCV."""
     try:
-        cap = cv2.VideoCapture(video_path)
+        cap = open_capture(video_path)
         if not cap.isOpened():
             raise ValueError(f"Could not open video file: {video_path}")
 
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = total_frames / fps if fps > 0 else 0
-
+        info = VideoInfo.from_capture(cap)
         cap.release()
 
-        return {
-            "width": width,
-            "height": height,
-            "fps": fps,
-            "total_frames": total_frames,
-            "duration": duration,
-        }
+        return info
     except Exception as e:
         print(f"Error getting video info: {e}")
         raise e
 
 
-def resize_with_opencv(
-    input_file, output_file, scale_factor, roi=None, progress_callback=None
-):
+def write_metadata(metadata, metadata_file):
+    """Write processing metadata as JSON, with orjson when it is installed."""
+    if orjson is not None:
+        with open(metadata_file, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                )
+            )
+    else:
+        with open(metadata_file, "w") as f:
+            json.dump(metadata, f, indent=4)
+
+
+def read_metadata(metadata_file):
+    """Read processing metadata JSON, with orjson when it is installed."""
+    if orjson is not None:
+        with open(metadata_file, "rb") as f:
+            return orjson.loads(f.read())
+    with open(metadata_file, "r") as f:
+        return json.load(f)
+
+
+def choose_fourcc(output_file, requested=None):
     """
-    Resize video using OpenCV, optionally cropping to a region of interest.
+    Choose the OpenCV fourcc for an output video.
 
     Args:
-        input_file (str): Path to input video file
         output_file (str): Path to output video file
-        scale_factor (int): Factor by which to scale the video resolution
-        roi (tuple, optional): Region of interest as (x, y, width, height)
-        progress_callback (function, optional): Function to call with progress updates
+        requested (str, optional): Fourcc to use (e.g. "FFV1" for lossless).
+            By default it is chosen from the file extension.
 
     Returns:
-        dict: Processing metadata including original and new dimensions, crop info, etc.
+        tuple: (output_file, fourcc). The extension is changed to one the codec
+        supports when the container does not match.
     """
-    try:
-        print(f"Processing video: {input_file}")
-
-        # Open input video
-        cap = cv2.VideoCapture(input_file)
-        if not cap.isOpened():
-            raise ValueError(f"Could not open video file: {input_file}")
+    name, ext = os.path.splitext(output_file)
+    ext = ext.lower()
+    fourcc = requested or CONTAINER_FOURCC.get(ext, "mp4v")
+    containers = FOURCC_CONTAINERS.get(fourcc, (ext,))
+    if ext not in containers:
+        output_file = name + containers[0]
+    return output_file, fourcc
+
+
+def _resize_video(
+    input_file,
+    output_file,
+    scale_factor,
+    roi,
+    progress_callback,
+    codec,
+    interpolation,
+    info,
+    encoder,
+):
+    """
+    Resize one video with the given ffmpeg encoder, or OpenCV's writer if None.
 
-        # Get video properties
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    Does the work of resize_with_opencv but raises on errors. FFmpegError is
+    raised when the ffmpeg encode fails, so that the caller can retry.
+    """
+    print(f"Processing video: {input_file}")
+
+    # Open input video
+    cap = open_capture(input_file)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video file: {input_file}")
+
+    # Get video properties
+    if info is None:
+        info = VideoInfo.from_capture(cap)
+    width, height = info.width, info.height
+    fps, total_frames = info.fps, info.total_frames
+
+    # Store video metadata
+    metadata = {
+        "original_video": os.path.basename(input_file),
+        "original_width": width,
+        "original_height": height,
+        "original_fps": fps,
+        "original_frames": total_frames,
+        "scale_factor": scale_factor,
+    }
+
+    # Determine output dimensions
+    if roi:
+        # If ROI is provided, use it
+        x, y, w, h = roi
+        new_width = int(w * scale_factor)
+        new_height = int(h * scale_factor)
+        message = f"Cropping to {w}x{h} and resizing to {new_width}x{new_height}"
 
-        # Store video metadata
-        metadata = {
-            "original_video": os.path.basename(input_file),
-            "original_width": width,
-            "original_height": height,
-            "original_fps": fps,
-            "original_frames": total_frames,
-            "scale_factor": scale_factor,
-        }
-
-        # Determine output dimensions
-        if roi:
-            # If ROI is provided, use it
-            x, y, w, h = roi
-            new_width = int(w * scale_factor)
-            new_height = int(h * scale_factor)
-            message = f"Cropping to {w}x{h} and resizing to {new_width}x{new_height}"
-
-            # Add crop info to metadata
-            metadata["crop"] = {"x": x, "y": y, "width": w, "height": h}
-            metadata["crop_applied"] = True
-        else:
-            # Full frame resize
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            message = f"Resizing from {width}x{height} to {new_width}x{new_height}"
-            metadata["crop_applied"] = False
+        # Add crop info to metadata
+        metadata["crop"] = {"x": x, "y": y, "width": w, "height": h}
+        metadata["crop_applied"] = True
+    else:
+        # Full frame resize
+        new_width = int(width * scale_factor)
+        new_height = int(height * scale_factor)
+        message = f"Resizing from {width}x{height} to {new_width}x{new_height}"
+        metadata["crop_applied"] = False
 
-        metadata["output_width"] = new_width
-        metadata["output_height"] = new_height
-        metadata["output_video"] = os.path.basename(output_file)
+    metadata["output_width"] = new_width
+    metadata["output_height"] = new_height
 
-        if progress_callback:
-            progress_callback(message)
-        print(message)
+    if progress_callback:
+        progress_callback(message)
+    print(message)
 
-        # Define codec and create VideoWriter object
-        fourcc = cv2.VideoWriter.fourcc(
-            *"XVID"
-        )  # XVID is more reliable across platforms
-        out = cv2.VideoWriter(output_file, fourcc, fps, (new_width, new_height))
+    # Encode through an ffmpeg pipe when an encoder is given
+    try:
+        if encoder:
+            out = FFmpegWriter(output_file, fps, (new_width, new_height), encoder)
+            # Record the padded size that is actually encoded
+            metadata["output_width"], metadata["output_height"] = out.size
+        else:
+            output_file, encoder = choose_fourcc(output_file, codec)
+            out = cv2.VideoWriter(
+                output_file,
+                cv2.VideoWriter.fourcc(*encoder),
+                fps,
+                (new_width, new_height),
+            )
+            if not out.isOpened() and not codec and encoder != "mp4v":
+                # The container's default codec is missing from this OpenCV build
+                output_file, encoder = choose_fourcc(output_file, "mp4v")
+                out = cv2.VideoWriter(
+                    output_file,
+                    cv2.VideoWriter.fourcc(*encoder),
+                    fps,
+                    (new_width, new_height),
+                )
+            if not out.isOpened():
+                raise ValueError(f"Codec {encoder} is not available for {output_file}")
+    except BaseException:
+        cap.release()
+        raise
+    metadata["encoder"] = encoder
+    metadata["output_video"] = os.path.basename(output_file)
+
+    # Decode, resize and encode run in three stages connected by bounded
+    # queues, so reading and writing overlap with the resize work
+    read_q = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+    write_q = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+    stop = threading.Event()
+    errors = []
+
+    def read_frames():
+        try:
+            while not stop.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                read_q.put(frame)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            read_q.put(None)
 
-        # Process the video frame by frame
+    def write_frames():
         frame_count = 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
+        try:
+            while True:
+                frame = write_q.get()
+                if frame is None:
+                    break
+
+                # Write the frame to the output video
+                out.write(frame)
+
+                # Update progress every 10 frames
+                frame_count += 1
+                if frame_count % 10 == 0:
+                    progress = (frame_count / total_frames) * 100
+                    status = f"Processing: {progress:.1f}% ({frame_count}/{total_frames})"
+                    print(status)
+                    if progress_callback:
+                        progress_callback(status)
+        except Exception as e:
+            errors.append(e)
+            # Stop decoding and keep draining so the resize stage never blocks
+            stop.set()
+            while write_q.get() is not None:
+                pass
+
+    # The ROI and frame size are fixed, so clamp the crop once
+    roi_slice = None
+    if roi:
+        x, y, w, h = roi
+        # Ensure ROI is within frame boundaries
+        x = max(0, min(x, width - 1))
+        y = max(0, min(y, height - 1))
+        w = min(w, width - x)
+        h = min(h, height - y)
+        roi_slice = (slice(y, y + h), slice(x, x + w))
+
+    # Power-of-two enlargements are done with repeated cv2.pyrUp on request
+    pyr_levels = 0
+    if interpolation == INTER_PYRUP:
+        pyr_levels = PYRUP_LEVELS.get(scale_factor, 0)
+        if roi and (w, h) != tuple(roi[2:]):
+            # A clamped crop no longer maps exactly onto the output size
+            pyr_levels = 0
+        interpolation = None
+    if interpolation is None:
+        interpolation = cv2.INTER_AREA if scale_factor < 1 else cv2.INTER_CUBIC
+    metadata["resize_method"] = "pyrup" if pyr_levels else "resize"
+    metadata["pixel_offset"] = 0.5 - 0.5 / scale_factor if pyr_levels else 0.0
+
+    # Resized frames go into a ring of preallocated buffers instead of a new
+    # array per frame. A buffer is only reused once the writer is done with
+    # it: at most FRAME_QUEUE_SIZE frames are queued plus one being written.
+    buffers = [
+        np.empty((new_height, new_width, 3), dtype=np.uint8)
+        for _ in range(0 if USE_UMAT else FRAME_QUEUE_SIZE + 2)
+    ]
+
+    reader = threading.Thread(target=read_frames, daemon=True)
+    writer = threading.Thread(target=write_frames, daemon=True)
+    reader.start()
+    writer.start()
+
+    completed = False
+    try:
+        for index in itertools.count():
+            frame = read_q.get()
+            if frame is None:
                 break
 
             # Apply ROI if specified
-            if roi:
-                x, y, w, h = roi
-                # Ensure ROI is within frame boundaries
-                x = max(0, min(x, width - 1))
-                y = max(0, min(y, height - 1))
-                w = min(w, width - x)
-                h = min(h, height - y)
-
-                # Crop the frame
-                frame = frame[y : y + h, x : x + w]
+            if roi_slice:
+                frame = frame[roi_slice]
 
             # Resize the frame
-            resized_frame = cv2.resize(
-                frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR
-            )
+            if USE_UMAT:
+                # Resize on the OpenCL device and download the result
+                frame = cv2.UMat(frame)
+                dst = None
+            else:
+                dst = buffers[index % len(buffers)]
+            if pyr_levels:
+                for _ in range(pyr_levels - 1):
+                    frame = cv2.pyrUp(frame)
+                resized_frame = cv2.pyrUp(frame, dst=dst)
+            else:
+                resized_frame = cv2.resize(
+                    frame,
+                    (new_width, new_height),
+                    dst=dst,
+                    interpolation=interpolation,
+                )
+            if USE_UMAT:
+                resized_frame = resized_frame.get()
+            write_q.put(resized_frame)
+        completed = True
+    finally:
+        stop.set()
+        write_q.put(None)
+        # Unblock the reader if it is waiting on a full queue
+        while reader.is_alive():
+            try:
+                read_q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        writer.join()
+
+        # Release resources, also when the resize loop raised
+        cap.release()
+        if errors or not completed:
+            # The first error is the one to report, not ffmpeg's exit status
+            try:
+                out.release()
+            except FFmpegError:
+                pass
 
-            # Write the frame to the output video
-            out.write(resized_frame)
+    if errors:
+        raise errors[0]
+    out.release()
 
-            # Update progress every 10 frames
-            frame_count += 1
-            if frame_count % 10 == 0:
-                progress = (frame_count / total_frames) * 100
-                status = f"Processing: {progress:.1f}% ({frame_count}/{total_frames})"
-                print(status)
-                if progress_callback:
-                    progress_callback(status)
+    # Save metadata to a JSON file with the same name as the output video
+    metadata_file = os.path.splitext(output_file)[0] + "_metadata.json"
+    write_metadata(metadata, metadata_file)
 
-        # Release resources
-        cap.release()
-        out.release()
+    print(f"Metadata saved to: {metadata_file}")
+    if progress_callback:
+        progress_callback(f"Metadata saved to: {os.path.basename(metadata_file)}")
 
-        # Save metadata to a JSON file with the same name as the output video
-        metadata_file = os.path.splitext(output_file)[0] + "_metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=4)
+    print(f"Video processed successfully: {output_file}")
+    if progress_callback:
+        progress_callback(f"Completed! Output: {output_file}")
 
-        print(f"Metadata saved to: {metadata_file}")
-        if progress_callback:
-            progress_callback(f"Metadata saved to: {os.path.basename(metadata_file)}")
+    # Return processing metadata
+    return metadata
 
-        print(f"Video processed successfully: {output_file}")
-        if progress_callback:
-            progress_callback(f"Completed! Output: {output_file}")
 
-        # Return processing metadata
-        return metadata
+def resize_with_opencv(
+    input_file,
+    output_file,
+    scale_factor,
+    roi=None,
+    progress_callback=None,
+    codec=None,
+    interpolation=None,
+    info=None,
+    encoder=None,
+):
+    """
+    Resize video using OpenCV, optionally cropping to a region of interest.
+
+    Args:
+        input_file (str): Path to input video file
+        output_file (str): Path to output video file
+        scale_factor (int): Factor by which to scale the video resolution
+        roi (tuple, optional): Region of interest as (x, y, width, height)
+        progress_callback (function, optional): Function to call with progress updates
+        codec (str, optional): OpenCV fourcc to encode with (e.g. "FFV1" for
+            lossless archival). By default H.264 is written through ffmpeg.
+        interpolation (int, optional): OpenCV interpolation flag, or
+            INTER_PYRUP to enlarge 2x, 4x and 8x with cv2.pyrUp. By default
+            enlargements use INTER_CUBIC and reductions INTER_AREA.
+        info (VideoInfo, optional): Properties of the input video, e.g. from
+            get_video_info. Read from the capture when not given.
+        encoder (str, optional): ffmpeg encoder, e.g. from get_ffmpeg_encoder.
+            Probed when not given.
+
+    Returns:
+        dict: Processing metadata including original and new dimensions, crop info, etc.
+
+    When an ffmpeg encoder fails, for example a hardware encoder that runs out
+    of sessions, the video is encoded again with libx264 and then with
+    OpenCV's writer.
+    """
+    try:
+        # Encode through an ffmpeg pipe unless a codec was requested
+        encoder = None if codec else encoder or get_ffmpeg_encoder()
+        while True:
+            try:
+                return _resize_video(
+                    input_file,
+                    output_file,
+                    scale_factor,
+                    roi,
+                    progress_callback,
+                    codec,
+                    interpolation,
+                    info,
+                    encoder,
+                )
+            except FFmpegError as e:
+                encoder = "libx264" if encoder != "libx264" else None
+                message = f"{e}. Retrying with {encoder or 'OpenCV VideoWriter'}"
+                print(message)
+                if progress_callback:
+                    progress_callback(message)
 
     except Exception as e:
         error_msg = f"Error during video processing: {str(e)}"
@@ -206,6 +691,72 @@ def resize_with_opencv(
         return None
 
 
+def resize_video_job(
+    video_file, output_path, scale_factor, progress_queue, encoder=None
+):
+    """
+    Resize one video in a batch worker process.
+
+    Progress messages are sent to `progress_queue` prefixed with the file name,
+    since several videos are processed at the same time. `encoder` is probed
+    once by the parent process rather than in every worker.
+    """
+    name = os.path.basename(video_file)
+    return resize_with_opencv(
+        video_file,
+        output_path,
+        scale_factor,
+        None,  # No ROI in batch mode
+        lambda msg: progress_queue.put(f"  [{name}] {msg}"),
+        encoder=encoder,
+    )
+
+
+def init_batch_worker(opencv_threads):
+    """
+    Limit OpenCV's internal thread pool in a batch worker process.
+
+    Each worker gets an equal share of the cores, so that the workers together
+    do not start more OpenCV threads than there are cores.
+    """
+    cv2.setNumThreads(opencv_threads)
+
+
+def batch_worker_count(video_files, scale_factor, encoder=None):
+    """
+    Number of worker processes for a batch resize.
+
+    Uses half of the CPU cores, limited so that the frames buffered by all
+    workers fit in half of the physical memory. With a hardware encoder at
+    most HW_ENCODER_SESSIONS videos are encoded at once.
+    """
+    workers = max(1, min(len(video_files), (os.cpu_count() or 2) // 2))
+    if encoder in HW_ENCODERS:
+        workers = min(workers, HW_ENCODER_SESSIONS)
+
+    try:
+        total_memory = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return workers
+
+    frame_bytes = 0
+    for video_file in video_files:
+        try:
+            info = get_video_info(video_file)
+        except Exception:
+            continue
+        frame_bytes = max(
+            frame_bytes,
+            int(info.width * scale_factor) * int(info.height * scale_factor) * 3,
+        )
+
+    # Both queues plus the ring of output buffers, per worker
+    worker_memory = frame_bytes * (3 * FRAME_QUEUE_SIZE + 2)
+    if worker_memory:
+        workers = max(1, min(workers, total_memory // 2 // worker_memory))
+    return workers
+
+
 def convert_coordinates(x, y, metadata):
     """
     Convert coordinates from processed video back to original video.
@@ -218,17 +769,159 @@ def convert_coordinates(x, y, metadata):
     Returns:
         tuple: (original_x, original_y) coordinates in the original video
     """
-    if not metadata["crop_applied"]:
-        # If no crop was applied, just divide by scale factor
-        original_x = x / metadata["scale_factor"]
-        original_y = y / metadata["scale_factor"]
+    return make_converter(metadata)(x, y)
+
+
+def get_coordinate_offset(metadata):
+    """
+    Offset added to scaled-down coordinates: the crop origin plus the pixel
+    grid shift of videos enlarged with cv2.pyrUp. Metadata written before the
+    shift was recorded has no "pixel_offset" and gets none.
+    """
+    pixel_offset = metadata.get("pixel_offset", 0.0)
+    if metadata["crop_applied"]:
+        return (
+            metadata["crop"]["x"] + pixel_offset,
+            metadata["crop"]["y"] + pixel_offset,
+        )
+    return pixel_offset, pixel_offset
+
+
+def make_converter(metadata):
+    """
+    Build a coordinate converter specialized for the given metadata.
+
+    The scale factor and crop offset are looked up once, so the returned
+    function only does the arithmetic. It accepts scalars or NumPy arrays.
+    Videos enlarged with cv2.pyrUp are corrected by their "pixel_offset".
+
+    Args:
+        metadata (dict): Video processing metadata from JSON file
+
+    Returns:
+        function: (x, y) -> (original_x, original_y)
+    """
+    scale = metadata["scale_factor"]
+    offset_x, offset_y = get_coordinate_offset(metadata)
+
+    if not offset_x and not offset_y:
+        # If no crop or grid shift was applied, just divide by scale factor
+        def convert(x, y):
+            return x / scale, y / scale
+
+    else:
+        # Otherwise first divide by scale factor, then add the offset
+        def convert(x, y):
+            return (x / scale) + offset_x, (y / scale) + offset_y
+
+    return convert
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _apply_xform(x, y, s, cx, cy, out_x, out_y):
+        """Scale and offset flat coordinate arrays in a single parallel pass."""
+        for i in prange(x.shape[0]):
+            out_x[i] = x[i] / s + cx
+            out_y[i] = y[i] / s + cy
+
+else:
+    _apply_xform = None
+
+
+def _numeric_block(frame):
+    """Return the columns of `frame` as a float64 array, non-numeric cells as NaN."""
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes):
+        return frame.to_numpy(dtype=np.float64)
+    return frame.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+
+
+def convert_coordinate_columns(df, converted_df, pairs, metadata):
+    """
+    Convert whole (x, y) coordinate columns back to the original video in place.
+
+    Values are read from `df` and written to `converted_df`. Only cells where
+    both x and y are numeric are converted; missing, empty or non-numeric cells
+    keep their original value.
+
+    Args:
+        df (pd.DataFrame): DataFrame with the processed-video coordinates
+        converted_df (pd.DataFrame): DataFrame that receives the converted values
+        pairs (list): List of (x_column, y_column) tuples
+        metadata (dict): Video processing metadata from JSON file
+    """
+    if not pairs:
+        return
+
+    x_cols = [x_col for x_col, _ in pairs]
+    y_cols = [y_col for _, y_col in pairs]
+
+    x = _numeric_block(df[x_cols])
+    y = _numeric_block(df[y_cols])
+    valid = ~(np.isnan(x) | np.isnan(y))
+
+    if _apply_xform is not None and x.size >= NUMBA_MIN_SIZE:
+        x = np.ascontiguousarray(x)
+        y = np.ascontiguousarray(y)
+        orig_x = np.empty(x.shape)
+        orig_y = np.empty(y.shape)
+        offset_x, offset_y = get_coordinate_offset(metadata)
+        _apply_xform(
+            x.ravel(),
+            y.ravel(),
+            float(metadata["scale_factor"]),
+            float(offset_x),
+            float(offset_y),
+            orig_x.ravel(),
+            orig_y.ravel(),
+        )
+    else:
+        orig_x, orig_y = make_converter(metadata)(x, y)
+
+    # Assign column by column so repeated labels behave like sequential writes
+    for j, (x_col, y_col) in enumerate(pairs):
+        mask = valid[:, j]
+        converted_df[x_col] = converted_df[x_col].mask(mask, orig_x[:, j])
+        converted_df[y_col] = converted_df[y_col].mask(mask, orig_y[:, j])
+
+
+def find_coordinate_pairs(columns, format_type):
+    """
+    Pair each x coordinate column with its y column.
+
+    Args:
+        columns (iterable): Column labels of the coordinates DataFrame
+        format_type (str): One of 'mediapipe', 'yolo', or 'vaila'
+
+    Returns:
+        list: (x_column, y_column) tuples, in column order
+    """
+    columns = list(columns)
+    column_set = set(columns)
+
+    if format_type == "mediapipe":
+        # nose_x -> nose_y
+        candidates = [(col, col[:-2] + "_y") for col in columns if col.endswith("_x")]
+    elif format_type == "yolo":
+        # ID_1 -> (X_1, Y_1)
+        person_ids = [col.split("_")[1] for col in columns if col.startswith("ID_")]
+        candidates = [(f"X_{pid}", f"Y_{pid}") for pid in person_ids]
+        candidates = [
+            (x_col, y_col) for x_col, y_col in candidates if x_col in column_set
+        ]
+    elif format_type == "vaila":
+        # p1_x -> p1_y, p1X -> p1Y (or p1y)
+        candidates = []
+        for col in columns:
+            if col.lower().endswith("x"):
+                base = col[:-1]
+                y_col = base + "y" if base + "y" in column_set else base + "Y"
+                candidates.append((col, y_col))
     else:
-        # If crop was applied, first divide by scale factor, then add crop offset
-        crop = metadata["crop"]
-        original_x = (x / metadata["scale_factor"]) + crop["x"]
-        original_y = (y / metadata["scale_factor"]) + crop["y"]
+        return []
 
-    return original_x, original_y
+    return [(x_col, y_col) for x_col, y_col in candidates if y_col in column_set]
 
 
 def convert_coordinates_by_format(df, metadata, format_type, progress_callback=None):
@@ -237,9 +930,17 @@ def convert_coordinates_by_format(df, metadata, format_type, progress_callback=N
     converted_df = df.copy()
 
     # Converter todas as colunas de coordenadas para float64 antes de qualquer processamento
-    coord_suffixes = ["x", "y", "X", "Y", "_x", "_y"]
-    for col in converted_df.columns:
-        if any(col.endswith(suffix) for suffix in coord_suffixes):
+    coord_cols = [col for col in converted_df.columns if COORD_COLUMN_RE.search(col)]
+    try:
+        # A single block conversion when every coordinate column is numeric
+        converted_df[coord_cols] = converted_df[coord_cols].astype("float64")
+        if progress_callback and coord_cols:
+            progress_callback(
+                f"Converted {len(coord_cols)} coordinate columns to float64"
+            )
+    except (ValueError, TypeError):
+        # Otherwise convert column by column and leave the non-numeric ones as they are
+        for col in coord_cols:
             try:
                 converted_df[col] = converted_df[col].astype("float64")
                 if progress_callback:
@@ -295,27 +996,11 @@ def convert_coordinates_by_format(df, metadata, format_type, progress_callback=N
         if progress_callback:
             progress_callback(f"Found {len(coord_columns)} coordinate columns")
 
-        processed = 0
-        for col in coord_columns:
-            if col.endswith("_x"):
-                x_col = col
-                y_col = col.replace("_x", "_y")
-
-                if y_col in df.columns:
-                    for idx, row in df.iterrows():
-                        if pd.notna(row[x_col]) and pd.notna(row[y_col]):
-                            orig_x, orig_y = convert_coordinates(
-                                row[x_col], row[y_col], metadata
-                            )
-                            converted_df.at[idx, x_col] = orig_x
-                            converted_df.at[idx, y_col] = orig_y
-                    processed += 1
-
-                    if processed % 10 == 0 and progress_callback:
-                        progress_callback(f"Processed {processed} coordinate pairs")
+        pairs = find_coordinate_pairs(df.columns, format_type)
+        convert_coordinate_columns(df, converted_df, pairs, metadata)
 
         if progress_callback:
-            progress_callback(f"Total coordinate pairs processed: {processed}")
+            progress_callback(f"Total coordinate pairs processed: {len(pairs)}")
 
     elif format_type == "yolo":
         if progress_callback:
@@ -325,31 +1010,13 @@ def convert_coordinates_by_format(df, metadata, format_type, progress_callback=N
         if progress_callback:
             progress_callback(f"Found {len(person_ids)} person IDs")
 
-        for pid in person_ids:
-            x_col = f"X_{pid}"
-            y_col = f"Y_{pid}"
+        pairs = find_coordinate_pairs(df.columns, format_type)
+        if progress_callback:
+            for x_col, _ in pairs:
+                progress_callback(f"Processing person ID: {x_col[2:]}")
 
-            if x_col in df.columns and y_col in df.columns:
-                if progress_callback:
-                    progress_callback(f"Processing person ID: {pid}")
-
-                for idx, row in df.iterrows():
-                    # Only convert non-empty values (NaN or empty string)
-                    x_val = row[x_col]
-                    y_val = row[y_col]
-
-                    # Handle different possible types of missing values
-                    if (
-                        pd.notna(x_val)
-                        and pd.notna(y_val)
-                        and x_val != ""
-                        and y_val != ""
-                    ):
-                        orig_x, orig_y = convert_coordinates(
-                            float(x_val), float(y_val), metadata
-                        )
-                        converted_df.at[idx, x_col] = orig_x
-                        converted_df.at[idx, y_col] = orig_y
+        # Empty strings and other non-numeric cells are left untouched
+        convert_coordinate_columns(df, converted_df, pairs, metadata)
 
     elif format_type == "vaila":
         if progress_callback:
@@ -360,44 +1027,16 @@ def convert_coordinates_by_format(df, metadata, format_type, progress_callback=N
         if progress_callback:
             progress_callback(f"Found {len(x_columns)} x-coordinate columns")
 
-        processed = 0
-        for x_col in x_columns:
-            # Get the base name by removing the 'x' at the end
-            base = x_col[:-1]
-            # Try both 'y' and 'Y' as possible suffix
-            possible_y_cols = [base + "y", base + "Y"]
-
-            # Find the corresponding y column
-            y_col = None
-            for possible_y in possible_y_cols:
-                if possible_y in df.columns:
-                    y_col = possible_y
-                    break
+        # Pair each x column with its 'y' or 'Y' counterpart
+        pairs = find_coordinate_pairs(df.columns, format_type)
 
-            if y_col:
-                if progress_callback:
-                    progress_callback(
-                        f"Processing coordinate pair: {x_col} and {y_col}"
-                    )
-
-                for idx, row in df.iterrows():
-                    if pd.notna(row[x_col]) and pd.notna(row[y_col]):
-                        try:
-                            orig_x, orig_y = convert_coordinates(
-                                float(row[x_col]), float(row[y_col]), metadata
-                            )
-                            converted_df.at[idx, x_col] = orig_x
-                            converted_df.at[idx, y_col] = orig_y
-                        except (ValueError, TypeError):
-                            # Skip if conversion to float fails
-                            pass
-
-                processed += 1
-                if progress_callback:
-                    progress_callback(f"Processed coordinate pair: {x_col}/{y_col}")
+        # Cells that cannot be converted to float are skipped
+        convert_coordinate_columns(df, converted_df, pairs, metadata)
 
         if progress_callback:
-            progress_callback(f"Total coordinate pairs processed: {processed}")
+            for x_col, y_col in pairs:
+                progress_callback(f"Processed coordinate pair: {x_col}/{y_col}")
+            progress_callback(f"Total coordinate pairs processed: {len(pairs)}")
 
     else:
         if progress_callback:
@@ -409,6 +1048,89 @@ def convert_coordinates_by_format(df, metadata, format_type, progress_callback=N
     return converted_df
 
 
+def iter_csv_chunks(csv_path, use_pyarrow=True, str_columns=()):
+    """
+    Yield a CSV file as a sequence of DataFrames.
+
+    pyarrow's multithreaded parser is used when it is installed, pandas'
+    chunked reader otherwise. pyarrow fixes column types from the first block,
+    so callers should retry with use_pyarrow=False if it raises
+    pyarrow.ArrowInvalid. The pandas reader starts again from the first row,
+    so any output written from the failed pass has to be discarded.
+
+    Column types are inferred per chunk, so they can differ between chunks;
+    see csv_chunk_dtypes.
+
+    Args:
+        csv_path (str): Path to the CSV file
+        use_pyarrow (bool): Parse with pyarrow when it is available
+        str_columns (iterable): Columns to read as text instead of inferring
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of rows
+    """
+    str_columns = list(str_columns)
+    if pa is not None and use_pyarrow:
+        reader = pacsv.open_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types=dict.fromkeys(str_columns, pa.string())
+            ),
+        )
+        # Close the reader before any fallback, even if parsing fails midway
+        with reader:
+            names = reader.schema.names
+            # Leave empty or repeated headers to pandas, which renames them
+            if "" not in names and len(set(names)) == len(names):
+                for batch in reader:
+                    yield batch.to_pandas()
+                return
+    yield from pd.read_csv(
+        csv_path, chunksize=CSV_CHUNK_SIZE, dtype=dict.fromkeys(str_columns, str)
+    )
+
+
+def csv_chunk_dtypes(csv_path, use_pyarrow=True):
+    """
+    Find the columns whose inferred type differs between chunks of a CSV file.
+
+    Reading the whole file at once gives each column a single type. Streamed
+    chunks are typed one at a time, so an integer column that is blank in only
+    some chunks would be written as 1 in some rows and 1.0 in others. This
+    makes a first pass over the file to find such columns.
+
+    Args:
+        csv_path (str): Path to the CSV file
+        use_pyarrow (bool): Parse with pyarrow when it is available
+
+    Returns:
+        tuple: (float_columns, str_columns). Columns that mix integer and float
+        chunks should be cast to float64; columns that mix numbers with text
+        or booleans should be read as text, as a whole-file read keeps them.
+    """
+    kinds = {}
+    with closing(iter_csv_chunks(csv_path, use_pyarrow)) as chunks:
+        for chunk in chunks:
+            for column, dtype in chunk.dtypes.items():
+                kind = dtype.kind if isinstance(dtype, np.dtype) else "O"
+                if kind == "O" and chunk[column].isna().all():
+                    # pyarrow gives all-null batches an object dtype
+                    kind = "f"
+                kinds.setdefault(column, set()).add(kind)
+
+    float_columns = []
+    str_columns = []
+    for column, column_kinds in kinds.items():
+        if len(column_kinds) == 1:
+            continue
+        if column_kinds <= {"i", "u", "f"}:
+            float_columns.append(column)
+        else:
+            str_columns.append(column)
+    return float_columns, str_columns
+
+
 def convert_mediapipe_coordinates(
     pixel_csv_path, metadata_path, output_csv_path, format_type, progress_callback=None
 ):
@@ -424,30 +1146,53 @@ def convert_mediapipe_coordinates(
     """
     try:
         # Load metadata
-        with open(metadata_path, "r") as f:
-            metadata = json.load(f)
+        metadata = read_metadata(metadata_path)
 
         if progress_callback:
             progress_callback(
                 f"Loaded metadata from: {os.path.basename(metadata_path)}"
             )
 
-        # Load CSV file
-        df = pd.read_csv(pixel_csv_path)
-
         if progress_callback:
             progress_callback(f"Loaded data file: {os.path.basename(pixel_csv_path)}")
-            progress_callback(f"Found {len(df)} frames")
 
-        # Convert coordinates based on format
-        converted_df = convert_coordinates_by_format(
-            df, metadata, format_type, progress_callback
-        )
+        # Stream the CSV file in chunks so memory does not grow with its length.
+        # A first pass fixes the column types that differ between chunks, so
+        # the output is formatted as if the whole file had been read at once.
+        def convert_chunks(use_pyarrow):
+            float_columns, str_columns = csv_chunk_dtypes(pixel_csv_path, use_pyarrow)
+            n_frames = 0
+            # Opening the output with "w" discards rows from a failed pass
+            with open(output_csv_path, "w", newline="") as out, closing(
+                iter_csv_chunks(pixel_csv_path, use_pyarrow, str_columns)
+            ) as chunks:
+                for i, chunk in enumerate(chunks):
+                    if float_columns:
+                        chunk = chunk.astype(dict.fromkeys(float_columns, "float64"))
+                    # Convert coordinates based on format, reporting details once
+                    converted_df = convert_coordinates_by_format(
+                        chunk,
+                        metadata,
+                        format_type,
+                        progress_callback if i == 0 else None,
+                    )
 
-        # Save converted DataFrame
-        converted_df.to_csv(output_csv_path, index=False)
+                    # Append the converted chunk to the open output file
+                    converted_df.to_csv(out, header=i == 0, index=False)
+                    n_frames += len(chunk)
+            return n_frames
+
+        try:
+            n_frames = convert_chunks(use_pyarrow=True)
+        except Exception as e:
+            if pa is None or not isinstance(e, pa.ArrowInvalid):
+                raise
+            # A column changed type after the first block; reparse the whole
+            # file with pandas, starting again from the first row
+            n_frames = convert_chunks(use_pyarrow=False)
 
         if progress_callback:
+            progress_callback(f"Found {n_frames} frames")
             progress_callback(
                 f"Converted coordinates saved to: {os.path.basename(output_csv_path)}"
             )
@@ -614,6 +1359,56 @@ class ROISelector:
                 )
 
 
+def drain_progress(window, text_widget, *queues, done=None, interval=100):
+    """
+    Show queued progress messages in a Tk text widget from the Tk main loop.
+
+    Worker threads never touch Tk widgets directly. They put strings (lines to
+    show) or callables (run on the Tk thread, e.g. StringVar updates) on the
+    queues, which are drained every `interval` ms. Pending lines are joined
+    into one insert and the view is scrolled once per drain, so a burst of
+    messages costs a single layout pass.
+    Polling stops once `done` is set and the queues are empty, or when the
+    window is closed.
+    """
+    if not window.winfo_exists():
+        return
+    finished = done is not None and done.is_set()
+
+    lines = []
+    inserted = False
+
+    def flush():
+        nonlocal inserted
+        if lines:
+            text_widget.insert(tk.END, "\n".join(lines) + "\n")
+            lines.clear()
+            inserted = True
+
+    for message_queue in queues:
+        while True:
+            try:
+                item = message_queue.get_nowait()
+            except queue.Empty:
+                break
+            if callable(item):
+                flush()
+                item()
+            else:
+                lines.append(item)
+    flush()
+    if inserted:
+        text_widget.see(tk.END)
+
+    if not finished:
+        window.after(
+            interval,
+            lambda: drain_progress(
+                window, text_widget, *queues, done=done, interval=interval
+            ),
+        )
+
+
 def validate_scale_factor(value, status_var):
     try:
         scale = int(value)
@@ -833,11 +1628,10 @@ converting MediaPipe coordinates back to the original video dimensions."""
         progress_text = tk.Text(progress_frame, height=15, width=70)
         progress_text.pack(fill=tk.BOTH, expand=True)
 
-        # Function to update progress text
-        def update_progress(message):
-            progress_text.insert(tk.END, message + "\n")
-            progress_text.see(tk.END)
-            convert_window.update()
+        # Messages are shown from the Tk main loop while the window is open
+        message_queue = queue.Queue()
+        update_progress = message_queue.put
+        drain_progress(convert_window, progress_text, message_queue)
 
         # Variables for file paths
         metadata_path_var = StringVar(value="No file selected")
@@ -970,8 +1764,11 @@ converting MediaPipe coordinates back to the original video dimensions."""
                     progress_callback(
                         f"Starting coordinate conversion with format: {format_type}"
                     )
-                    status_var.set(
-                        f"Converting coordinates using {format_type} format..."
+                    progress_callback(
+                        partial(
+                            status_var.set,
+                            f"Converting coordinates using {format_type} format...",
+                        )
                     )
 
                     # Run the conversion with the selected format type
@@ -988,7 +1785,9 @@ converting MediaPipe coordinates back to the original video dimensions."""
                         progress_callback(
                             f"Original coordinates saved to: {os.path.basename(output_path)}"
                         )
-                        status_var.set("Coordinate conversion completed")
+                        progress_callback(
+                            partial(status_var.set, "Coordinate conversion completed")
+                        )
 
                         # Show success message
                         convert_window.after(
@@ -1002,12 +1801,16 @@ converting MediaPipe coordinates back to the original video dimensions."""
                         progress_callback(
                             "\nConversion failed. See error messages above."
                         )
-                        status_var.set("Coordinate conversion failed")
+                        progress_callback(
+                            partial(status_var.set, "Coordinate conversion failed")
+                        )
 
                 except Exception as e:
                     error_msg = f"Error during conversion: {str(e)}"
                     progress_callback(error_msg)
-                    status_var.set("Error during conversion")
+                    progress_callback(
+                        partial(status_var.set, "Error during conversion")
+                    )
 
             # Start the conversion in a separate thread
             thread = threading.Thread(target=conversion_thread)
@@ -1052,12 +1855,14 @@ converting MediaPipe coordinates back to the original video dimensions."""
         batch_output_dir = os.path.join(output_dir, f"cropped_resized_{timestamp}")
         os.makedirs(batch_output_dir, exist_ok=True)
 
-        # Setup output file path
-        input_filename = os.path.basename(video_file)
-        name, ext = os.path.splitext(input_filename)
+        # Setup output file paths
+        input_path = Path(video_file)
+        input_filename = input_path.name
         x, y, w, h = roi
-        output_filename = f"{name}_crop_{x}_{y}_{w}_{h}_{scale_factor}x{ext}"
-        output_path = os.path.join(batch_output_dir, output_filename)
+        output_path = Path(batch_output_dir) / (
+            f"{input_path.stem}_crop_{x}_{y}_{w}_{h}_{scale_factor}x{input_path.suffix}"
+        )
+        metadata_filename = output_path.stem + "_metadata.json"
 
         # Progress window
         progress_window = tk.Toplevel(root)
@@ -1067,11 +1872,15 @@ converting MediaPipe coordinates back to the original video dimensions."""
         progress_text = tk.Text(progress_window, height=15, width=70)
         progress_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Function to update progress text
-        def update_progress(message):
-            progress_text.insert(tk.END, message + "\n")
-            progress_text.see(tk.END)
-            progress_window.update()
+        # The processing thread queues messages; the Tk main loop shows them
+        message_queue = queue.Queue()
+        update_progress = message_queue.put
+        done = threading.Event()
+
+        def add_close_button():
+            Button(
+                progress_window, text="Close", command=progress_window.destroy
+            ).pack(pady=10)
 
         # Start processing in a thread
         def process_thread():
@@ -1080,19 +1889,16 @@ converting MediaPipe coordinates back to the original video dimensions."""
                 update_progress(f"ROI: x={x}, y={y}, width={w}, height={h}")
                 update_progress(f"Scale: {scale_factor}x")
 
-                status_var.set(f"Processing video with ROI...")
+                update_progress(partial(status_var.set, "Processing video with ROI..."))
 
                 # Process the video
                 metadata = resize_with_opencv(
-                    video_file, output_path, scale_factor, roi, update_progress
+                    video_file, str(output_path), scale_factor, roi, update_progress
                 )
 
                 if metadata:
                     update_progress(f"Success! Output saved to: {output_path}")
-                    metadata_file = os.path.splitext(output_path)[0] + "_metadata.json"
-                    update_progress(
-                        f"Metadata saved to: {os.path.basename(metadata_file)}"
-                    )
+                    update_progress(f"Metadata saved to: {metadata_filename}")
 
                     update_progress(
                         "\nTo convert MediaPipe coordinates back to original video:"
@@ -1101,25 +1907,30 @@ converting MediaPipe coordinates back to the original video dimensions."""
                         "Click 'Convert MediaPipe Coordinates' button after processing"
                     )
 
-                    status_var.set("Crop and resize completed successfully")
+                    update_progress(
+                        partial(
+                            status_var.set, "Crop and resize completed successfully"
+                        )
+                    )
                 else:
                     update_progress("Failed to process video")
-                    status_var.set("Failed to process video")
+                    update_progress(partial(status_var.set, "Failed to process video"))
 
                 # Add close button
-                Button(
-                    progress_window, text="Close", command=progress_window.destroy
-                ).pack(pady=10)
+                update_progress(add_close_button)
 
             except Exception as e:
                 error_msg = f"Error: {str(e)}"
                 update_progress(error_msg)
-                status_var.set(error_msg)
+                update_progress(partial(status_var.set, error_msg))
+            finally:
+                done.set()
 
         # Start thread
         thread = threading.Thread(target=process_thread)
         thread.daemon = True
         thread.start()
+        drain_progress(progress_window, progress_text, message_queue, done=done)
 
     def start_batch_processing(
         input_dir, output_dir, scale_factor, use_roi, status_var, root
@@ -1141,11 +1952,16 @@ converting MediaPipe coordinates back to the original video dimensions."""
         progress_text = tk.Text(progress_window, height=20, width=70)
         progress_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Function to update progress text
-        def update_progress(message):
-            progress_text.insert(tk.END, message + "\n")
-            progress_text.see(tk.END)
-            progress_window.update()
+        # The processing thread queues messages and forwards those of the
+        # worker processes; the Tk main loop shows them
+        message_queue = queue.Queue()
+        update_progress = message_queue.put
+        done = threading.Event()
+
+        def add_close_button():
+            Button(
+                progress_window, text="Close", command=progress_window.destroy
+            ).pack(pady=10)
 
         # Start processing in a new thread
         def process_thread():
@@ -1158,22 +1974,14 @@ converting MediaPipe coordinates back to the original video dimensions."""
                 os.makedirs(batch_output_dir, exist_ok=True)
 
                 # Find video files
-                video_extensions = (
-                    ".mp4",
-                    ".avi",
-                    ".mov",
-                    ".mkv",
-                    ".MP4",
-                    ".AVI",
-                    ".MOV",
-                    ".MKV",
-                )
-                video_files = [
-                    os.path.join(input_dir, f)
-                    for f in os.listdir(input_dir)
-                    if os.path.isfile(os.path.join(input_dir, f))
-                    and f.endswith(video_extensions)
-                ]
+                video_extensions = (".mp4", ".avi", ".mov", ".mkv")
+                with os.scandir(input_dir) as entries:
+                    video_files = [
+                        entry.path
+                        for entry in entries
+                        if entry.is_file()
+                        and entry.name.lower().endswith(video_extensions)
+                    ]
 
                 if not video_files:
                     update_progress("No video files found in the selected directory.")
@@ -1182,59 +1990,104 @@ converting MediaPipe coordinates back to the original video dimensions."""
                 update_progress(
                     f"Found {len(video_files)} videos to process with {scale_factor}x scaling"
                 )
-                status_var.set(f"Processing {len(video_files)} videos...")
-
-                # Process each video
-                for i, video_file in enumerate(video_files, 1):
-                    try:
-                        input_filename = os.path.basename(video_file)
-                        name, ext = os.path.splitext(input_filename)
-                        output_filename = f"{name}_{scale_factor}x{ext}"
-                        output_path = os.path.join(batch_output_dir, output_filename)
-
-                        update_progress(
-                            f"\n[{i}/{len(video_files)}] Processing: {input_filename}"
+                update_progress(
+                    partial(status_var.set, f"Processing {len(video_files)} videos...")
+                )
+
+                # Each video is resized in its own worker process. ffmpeg is
+                # probed once here and the encoder is passed to every job.
+                encoder = get_ffmpeg_encoder()
+                max_workers = batch_worker_count(video_files, scale_factor, encoder)
+                update_progress(f"Using {max_workers} worker processes")
+
+                output_dir_path = Path(batch_output_dir)
+                opencv_threads = max(1, (os.cpu_count() or 1) // max_workers)
+                # The executor exits first, so the workers are done with the
+                # Manager queue before the Manager shuts down
+                with multiprocessing.Manager() as manager, ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=init_batch_worker,
+                    initargs=(opencv_threads,),
+                ) as executor:
+                    # Worker processes need a Manager queue
+                    progress_queue = manager.Queue()
+
+                    def forward_worker_messages():
+                        while True:
+                            try:
+                                update_progress(progress_queue.get_nowait())
+                            except queue.Empty:
+                                return
+
+                    futures = {}
+                    for video_file in video_files:
+                        input_path = Path(video_file)
+                        output_path = output_dir_path / (
+                            f"{input_path.stem}_{scale_factor}x{input_path.suffix}"
                         )
 
-                        # Process with OpenCV (no ROI for batch mode)
-                        metadata = resize_with_opencv(
+                        future = executor.submit(
+                            resize_video_job,
                             video_file,
-                            output_path,
+                            str(output_path),
                             scale_factor,
-                            None,  # No ROI in batch mode
-                            lambda msg: update_progress(f"  {msg}"),
+                            progress_queue,
+                            encoder,
                         )
+                        futures[future] = (input_path, output_path)
 
-                        if metadata:
-                            update_progress(f"  Completed: {output_filename}")
-                            metadata_file = (
-                                os.path.splitext(output_path)[0] + "_metadata.json"
-                            )
-                            update_progress(
-                                f"  Metadata saved to: {os.path.basename(metadata_file)}"
-                            )
-                        else:
-                            update_progress(f"  Failed to process: {input_filename}")
-
-                    except Exception as e:
-                        update_progress(f"  Error processing {video_file}: {str(e)}")
+                    i = 0
+                    pending = set(futures)
+                    while pending:
+                        finished, pending = wait(
+                            pending, timeout=0.1, return_when=FIRST_COMPLETED
+                        )
+                        forward_worker_messages()
+                        for future in finished:
+                            i += 1
+                            input_path, output_path = futures[future]
+                            input_filename = input_path.name
+                            output_filename = output_path.name
+                            try:
+                                metadata = future.result()
+                                update_progress(
+                                    f"\n[{i}/{len(video_files)}] "
+                                    f"Finished: {input_filename}"
+                                )
+
+                                if metadata:
+                                    update_progress(f"  Completed: {output_filename}")
+                                    update_progress(
+                                        "  Metadata saved to: "
+                                        f"{output_path.stem}_metadata.json"
+                                    )
+                                else:
+                                    update_progress(
+                                        f"  Failed to process: {input_filename}"
+                                    )
+
+                            except Exception as e:
+                                update_progress(
+                                    f"  Error processing {input_path}: {str(e)}"
+                                )
 
                 update_progress("\nBatch processing complete!")
-                status_var.set("Processing complete!")
+                update_progress(partial(status_var.set, "Processing complete!"))
 
                 # Add close button
-                Button(
-                    progress_window, text="Close", command=progress_window.destroy
-                ).pack(pady=10)
+                update_progress(add_close_button)
 
             except Exception as e:
                 update_progress(f"Error in batch processing: {str(e)}")
-                status_var.set(f"Error: {str(e)}")
+                update_progress(partial(status_var.set, f"Error: {str(e)}"))
+            finally:
+                done.set()
 
         # Start processing thread
         thread = threading.Thread(target=process_thread)
         thread.daemon = True
         thread.start()
+        drain_progress(progress_window, progress_text, message_queue, done=done)
 
     root.mainloop()
 
@@ -43,6 +43,8 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, Toplevel, Label, Button
 import re
 
+FRAME_NUMBER_RE = re.compile(r"(\d+)")
+
 
 class FrameRemover:
     def __init__(self):
@@ -52,7 +54,7 @@ class FrameRemover:
 
     def extract_frame_number(self, filename):
         """Extract the numeric frame number from filename"""
-        match = re.search(r"(\d+)", os.path.basename(filename))
+        match = FRAME_NUMBER_RE.search(os.path.basename(filename))
         if match:
             return int(match.group(1))
         return None
@@ -166,7 +168,7 @@ class FrameRemover:
 
         # Determine pattern from first file
         first_file = frame_files[0]
-        match = re.search(r"(\d+)", first_file)
+        match = FRAME_NUMBER_RE.search(first_file)
         if not match:
             print(f"Could not extract frame numbering pattern from {first_file}")
             return None
@@ -21,9 +21,11 @@ Main Features:
 
     Euler Angles and Quaternions:
         - `rotmat2euler`: Converts a rotation matrix to Euler angles in degrees.
+        - `rotmat2euler_batch`: Vectorized conversion of a stack of rotation matrices (n, 3, 3) to Euler angles.
         - `rotmat2quat`: Converts a rotation matrix to quaternions.
 
     Data Rotation:
+        - `rotate_markers`: Applies one rotation matrix per frame to an (n, m, 3) marker array.
         - `rotdata`: Rotates a set of data points using specified rotation angles around the x, y, and z axes, with customizable order of rotations (e.g., 'xyz', 'zyx').
 
 Key Functions and Their Functionality:
@@ -285,6 +287,53 @@ def rotmat2euler(matrot):
     return euler_angles_degrees
 
 
+def rotmat2euler_batch(matrot):
+    """
+    Convert a stack of rotation matrices to Euler angles in degrees.
+
+    Vectorized counterpart of `rotmat2euler` for whole trials: the conversion is
+    done with array-wide arctan2 calls instead of one call per frame. Uses the
+    same extrinsic 'xyz' convention, including the gimbal-lock case where the
+    third angle is set to zero.
+
+    Parameters:
+    matrot (np.ndarray): The rotation matrices, shape (n, 3, 3).
+
+    Returns:
+    np.ndarray: The Euler angles (phi, theta, psi) in degrees, shape (n, 3).
+    """
+    matrot = np.asarray(matrot, dtype=float)
+    if matrot.ndim == 2:
+        matrot = matrot[np.newaxis]
+    if matrot.shape[-2:] != (3, 3):
+        raise ValueError("matrot must have shape (n, 3, 3)")
+
+    sy = np.hypot(matrot[:, 0, 0], matrot[:, 1, 0])
+    singular = sy < 1e-6
+    x = np.where(
+        singular,
+        np.arctan2(-matrot[:, 1, 2], matrot[:, 1, 1]),
+        np.arctan2(matrot[:, 2, 1], matrot[:, 2, 2]),
+    )
+    y = np.arctan2(-matrot[:, 2, 0], sy)
+    z = np.where(singular, 0.0, np.arctan2(matrot[:, 1, 0], matrot[:, 0, 0]))
+    return np.degrees(np.stack([x, y, z], axis=-1))
+
+
+def rotate_markers(matrot, xyz):
+    """
+    Rotate every marker of every frame with the rotation matrix of that frame.
+
+    Parameters:
+    matrot (np.ndarray): Rotation matrices, shape (n, 3, 3), e.g. from `calcmatrot`.
+    xyz (np.ndarray): Marker coordinates, shape (n, m, 3), e.g. from `read_mocap_xyz`.
+
+    Returns:
+    np.ndarray: The rotated coordinates, shape (n, m, 3).
+    """
+    return np.einsum("fij,fmj->fmi", matrot, xyz)
+
+
 def rotmat2quat(matrot):
     """
     Convert a rotation matrix to quaternions.
@@ -26,13 +26,8 @@ Usage:
 
 import os
 import numpy as np
-import ezc3d
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import tkinter as tk
 from tkinter import filedialog
-from matplotlib.widgets import Slider, Button
 
 
 def load_c3d_file():
@@ -56,6 +51,8 @@ def load_c3d_file():
         print("No file selected. Exiting.")
         exit(0)
 
+    import ezc3d
+
     c3d = ezc3d.c3d(filepath)
     fps = c3d["header"]["points"]["frame_rate"]
     pts = c3d["data"]["points"]
@@ -135,6 +132,11 @@ def draw_cartesian_axes(ax, axis_length=0.25):
 
 
 def main():
+    # Heavy plotting dependencies are only needed once the viewer is opened
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 (registers the 3d projection)
+    from matplotlib.widgets import Slider, Button
+
     # Load data from the C3D file
     pts, filepath, fps, marker_labels = load_c3d_file()
     num_frames, total_markers, _ = pts.shape
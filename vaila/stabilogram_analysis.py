@@ -16,14 +16,30 @@ The main features of this module include:
 - **CSV Export of Metrics**: Saves computed metrics to a CSV file with standardized headers, ensuring compatibility with other data analysis tools.
 
 Author: Prof. Dr. Paulo R. P. Santiago
-Version: 1.3
-Date: 2024-09-12
+Version: 1.4
+Date: 2026-10-15
 
 References:
 - GitHub Repository: Code Descriptors Postural Control. https://github.com/Jythen/code_descriptors_postural_control
 - "Physiological Reports" - A detailed article on the usage of stabilogram analysis in postural control research. https://doi.org/10.14814/phy2.15067
 
 Changelog:
+- Version 1.4 (2026-10-15):
+  - `compute_sway_density` counts neighbours by bisection on the sorted signal instead of an O(N²) loop.
+  - `compute_sway_density` runs the bisection in a parallel Numba kernel when Numba is installed.
+  - `compute_rms` sums squares with `np.einsum`; `plot_stabilogram` reuses it.
+  - `compute_power_spectrum` runs Welch's method on both axes in a single call.
+  - `save_metrics_to_csv` writes with the standard `csv` module instead of pandas.
+  - Metric headers are standardized with a single `str.translate` table.
+  - `compute_total_path_length` computes the step lengths in place.
+  - `compute_speed` filters both axes with a single `savgol_filter` call.
+  - Signal lines in the stabilogram and PSD plots are rasterized in the SVG output.
+  - `plot_stabilogram` and `plot_power_spectrum` reuse one `Figure` each instead of a new pyplot figure per call.
+  - `compute_msd` sums squared differences with `np.einsum`.
+  - Added `compute_msd_curve` to compute the MSD of many time intervals from one FFT autocorrelation.
+  - `count_zero_crossings` compares boolean sign masks instead of multiplying neighbouring samples.
+  - SciPy and Matplotlib are imported on first use, so importing the module only loads NumPy.
+  - `count_peaks` counts rise-to-fall transitions with NumPy instead of calling `find_peaks`.
 - Version 1.3 (2024-09-12):
   - Enhanced `plot_power_spectrum` function to include indicators for maximum PSD values and their corresponding frequencies.
   - Introduced `compute_total_path_length` function to calculate the total path length of the CoP trajectory.
@@ -42,12 +58,27 @@ rms_ml, rms_ap = compute_rms(cop_x, cop_y)
 speed_ml, speed_ap = compute_speed(cop_x, cop_y, fs)
 plot_stabilogram(time, cop_x, cop_y, output_path)
 compute_msd(S_n, fs, delta_t)
+compute_msd_curve(S_n, fs, delta_ts)
 # and so on.
 """
 
+import csv
+import os
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.signal import welch, savgol_filter, find_peaks
+
+# SciPy and Matplotlib are imported inside the functions that use them, so that
+# importing this module for the basic metrics stays cheap
+
+# Characters replaced in the metric names used as CSV headers
+HEADER_TRANSLATION = str.maketrans(
+    {" ": "_", "(": "_", ")": "", "²": "2", "·": "_", "³": "3"}
+)
+
+# Figures reused by the plotting functions, keyed by plot type
+_figures = {}
+
+# Numba kernel for compute_sway_density, compiled on first use when available
+_sway_kernel = None
 
 
 def compute_rms(cop_x, cop_y):
@@ -66,8 +97,11 @@ def compute_rms(cop_x, cop_y):
     - rms_ap: float
         RMS displacement in the AP direction.
     """
-    rms_ml = np.sqrt(np.mean(cop_x**2))
-    rms_ap = np.sqrt(np.mean(cop_y**2))
+    cop_x = np.asarray(cop_x, dtype=float)
+    cop_y = np.asarray(cop_y, dtype=float)
+    # Sum of squares without allocating the squared signal
+    rms_ml = np.sqrt(np.einsum("i,i->", cop_x, cop_x) / cop_x.size)
+    rms_ap = np.sqrt(np.einsum("i,i->", cop_y, cop_y) / cop_y.size)
     return rms_ml, rms_ap
 
 
@@ -93,13 +127,18 @@ def compute_speed(cop_x, cop_y, fs, window_length=5, polyorder=3):
     - speed_ap: array-like
         Speed in the AP direction.
     """
+    from scipy.signal import savgol_filter
+
     delta = 1 / fs
     # Ensure window_length is odd and less than data length
     window_length = min(window_length, len(cop_x) // 2 * 2 - 1)
     if window_length % 2 == 0:
         window_length += 1
-    speed_ml = savgol_filter(cop_x, window_length, polyorder, deriv=1, delta=delta)
-    speed_ap = savgol_filter(cop_y, window_length, polyorder, deriv=1, delta=delta)
+    # Filter both axes in one call
+    speed = savgol_filter(
+        np.vstack([cop_x, cop_y]), window_length, polyorder, deriv=1, delta=delta, axis=1
+    )
+    speed_ml, speed_ap = speed[0], speed[1]
     return speed_ml, speed_ap
 
 
@@ -125,9 +164,11 @@ def compute_power_spectrum(cop_x, cop_y, fs):
     - psd_ap: array-like
         PSD values for the AP direction.
     """
-    freqs_ml, psd_ml = welch(cop_x, fs=fs, nperseg=256)
-    freqs_ap, psd_ap = welch(cop_y, fs=fs, nperseg=256)
-    return freqs_ml, psd_ml, freqs_ap, psd_ap
+    from scipy.signal import welch
+
+    # Both axes in one call, so the segment FFTs are batched together
+    freqs, psd = welch(np.vstack([cop_x, cop_y]), fs=fs, nperseg=256, axis=-1)
+    return freqs, psd[0], freqs, psd[1]
 
 
 def compute_msd(S_n, fs, delta_t):
@@ -151,7 +192,45 @@ def compute_msd(S_n, fs, delta_t):
     if delta_n >= N:
         raise ValueError("delta_t is too large for the signal length.")
     diff = S_n[delta_n:] - S_n[:-delta_n]
-    msd = np.mean(diff**2)
+    # Sum of squares without allocating the squared differences
+    msd = np.einsum("i,i->", diff, diff) / diff.size
+    return msd
+
+
+def compute_msd_curve(S_n, fs, delta_t):
+    """
+    Calculates the MSD for many time intervals at once.
+
+    Gives the values of `compute_msd` for each interval, up to rounding, but the
+    lagged products of all intervals come from a single FFT autocorrelation,
+    so the cost is O(N log N) instead of O(N) per interval.
+
+    Parameters:
+    - S_n: array-like
+        Centered signal (X_n or Y_n).
+    - fs: float
+        Sampling frequency in Hz.
+    - delta_t: array-like
+        Time intervals in seconds.
+
+    Returns:
+    - msd: array-like
+        MSD value for each time interval.
+    """
+    from scipy.signal import correlate
+
+    S_n = np.asarray(S_n, dtype=float)
+    delta_n = (np.asarray(delta_t, dtype=float) * fs).astype(int)
+    N = len(S_n)
+    if np.any(delta_n >= N):
+        raise ValueError("delta_t is too large for the signal length.")
+    if np.any(delta_n < 1):
+        raise ValueError("delta_t is too small for the sampling frequency.")
+    # sum((S[i + d] - S[i])**2) = sum(S[d:]**2) + sum(S[:-d]**2) - 2 * acf[d]
+    cumulative_sq = np.concatenate(([0.0], np.cumsum(S_n * S_n)))
+    acf = correlate(S_n, S_n, mode="full", method="fft")[N - 1 :]
+    sum_sq = (cumulative_sq[N] - cumulative_sq[delta_n]) + cumulative_sq[N - delta_n]
+    msd = (sum_sq - 2 * acf[delta_n]) / (N - delta_n)
     return msd
 
 
@@ -159,6 +238,9 @@ def count_zero_crossings(signal):
     """
     Counts the number of zero-crossings in a signal.
 
+    A crossing is a pair of neighbouring samples with strictly opposite signs;
+    samples that are exactly zero do not start or end a crossing.
+
     Parameters:
     - signal: array-like
         Signal to be analyzed.
@@ -167,7 +249,13 @@ def count_zero_crossings(signal):
     - zero_crossings: int
         Number of zero-crossings.
     """
-    zero_crossings = ((signal[:-1] * signal[1:]) < 0).sum()
+    signal = np.asarray(signal)
+    # Boolean sign masks instead of a float product of neighbouring samples
+    positive = signal > 0
+    negative = signal < 0
+    zero_crossings = np.count_nonzero(
+        (positive[:-1] & negative[1:]) | (negative[:-1] & positive[1:])
+    )
     return zero_crossings
 
 
@@ -175,6 +263,10 @@ def count_peaks(signal):
     """
     Counts the number of peaks in a signal.
 
+    Gives the same count as `scipy.signal.find_peaks(signal)` without extra
+    arguments: a peak is a rise followed by a fall, with any run of equal
+    samples (a flat peak) in between counted once.
+
     Parameters:
     - signal: array-like
         Signal to be analyzed.
@@ -183,8 +275,14 @@ def count_peaks(signal):
     - num_peaks: int
         Number of detected peaks.
     """
-    peaks, _ = find_peaks(signal)
-    num_peaks = len(peaks)
+    signal = np.asarray(signal)
+    rising = signal[1:] > signal[:-1]
+    falling = signal[1:] < signal[:-1]
+    # Drop the steps between equal samples so plateaus join their neighbours
+    changed = signal[1:] != signal[:-1]
+    rising = rising[changed]
+    falling = falling[changed]
+    num_peaks = int(np.count_nonzero(rising[:-1] & falling[1:]))
     return num_peaks
 
 
@@ -204,14 +302,93 @@ def compute_sway_density(cop_signal, fs, radius=0.3):
     - sway_density: array-like
         Sway density values.
     """
+    cop_signal = np.asarray(cop_signal, dtype=float)
     N = len(cop_signal)
-    sway_density = np.zeros(N)
-    for t in range(N):
-        distances = np.abs(cop_signal - cop_signal[t])
-        sway_density[t] = np.sum(distances <= radius) / N
+
+    # Count the samples within the radius of each sample by bisection on the
+    # sorted signal. Columns of a 2D signal are counted independently.
+    columns = cop_signal.T if cop_signal.ndim > 1 else cop_signal[np.newaxis]
+    counts = np.zeros(N, dtype=np.int64)
+    kernel = _get_sway_kernel()
+    for signal in columns:
+        sorted_signal = np.sort(signal)
+        if kernel is not None:
+            counts += kernel(sorted_signal, np.ascontiguousarray(signal), radius)
+            continue
+        left = _bisect_difference(sorted_signal, signal, -radius, inclusive=False)
+        right = _bisect_difference(sorted_signal, signal, radius, inclusive=True)
+        counts += right - left
+
+    sway_density = counts / N
     return sway_density
 
 
+def _bisect_difference(sorted_signal, signal, bound, inclusive):
+    """
+    For each sample, finds the first index of `sorted_signal` whose difference
+    from the sample is above `bound` (or at least `bound` if not inclusive).
+
+    The difference is computed as `sorted_signal[j] - signal[t]`, exactly as a
+    direct comparison would, so values on the radius boundary are counted the
+    same way. NaN samples get index 0.
+    """
+    n = len(sorted_signal)
+    lo = np.zeros(len(signal), dtype=np.intp)
+    hi = np.full(len(signal), n, dtype=np.intp)
+    active = lo < hi
+    while active.any():
+        mid = (lo + hi) // 2
+        diff = sorted_signal[np.minimum(mid, n - 1)] - signal
+        before = diff <= bound if inclusive else diff < bound
+        lo = np.where(active & before, mid + 1, lo)
+        hi = np.where(active & ~before, mid, hi)
+        active = lo < hi
+    return lo
+
+
+def _get_sway_kernel():
+    """
+    Returns a Numba-compiled sway density counter, or None without Numba.
+
+    Each sample runs the same two bisections as `_bisect_difference` in its
+    own parallel iteration, without temporary arrays.
+    """
+    global _sway_kernel
+    if _sway_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _sway_kernel = False
+            return None
+
+        @njit(parallel=True)
+        def sway_counts(sorted_signal, signal, radius):
+            n = sorted_signal.shape[0]
+            counts = np.zeros(signal.shape[0], dtype=np.int64)
+            for t in prange(signal.shape[0]):
+                value = signal[t]
+                lo, hi = 0, n
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if sorted_signal[mid] - value < -radius:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                left = lo
+                hi = n
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if sorted_signal[mid] - value <= radius:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                counts[t] = lo - left
+            return counts
+
+        _sway_kernel = sway_counts
+    return _sway_kernel or None
+
+
 def compute_total_path_length(cop_x, cop_y):
     """
     Calculates the total path length of the CoP trajectory.
@@ -226,17 +403,44 @@ def compute_total_path_length(cop_x, cop_y):
     - total_path_length: float
         Total path length in cm.
     """
-    diffs_x = np.diff(cop_x)
-    diffs_y = np.diff(cop_y)
-    distances = np.sqrt(diffs_x**2 + diffs_y**2)
+    # Square, add and take the root in place on the two difference arrays
+    diffs_x = np.diff(cop_x).astype(float, copy=False)
+    diffs_y = np.diff(cop_y).astype(float, copy=False)
+    np.multiply(diffs_x, diffs_x, out=diffs_x)
+    np.multiply(diffs_y, diffs_y, out=diffs_y)
+    diffs_x += diffs_y
+    distances = np.sqrt(diffs_x, out=diffs_x)
     total_path_length = np.sum(distances)
     return total_path_length
 
 
+def _reuse_figure(name, figsize, nrows=1):
+    """
+    Returns a cached Figure for `name` with its axes cleared.
+
+    The figures are created once with the object-oriented API (not pyplot)
+    and reused by later calls, so batch analyses do not build a new canvas
+    per trial. They are shared module state: do not plot from several threads
+    at once.
+    """
+    fig = _figures.get(name)
+    if fig is None:
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize)
+        fig.subplots(nrows, 1)
+        _figures[name] = fig
+    for ax in fig.axes:
+        ax.cla()
+    return fig
+
+
 def plot_stabilogram(time, cop_x, cop_y, output_path):
     """
     Plots and saves the stabilogram as time series plots for ML and AP displacements.
 
+    The figure is reused between calls and is not thread-safe.
+
     Parameters:
     - time: array-like
         Time vector.
@@ -247,52 +451,53 @@ def plot_stabilogram(time, cop_x, cop_y, output_path):
     - output_path: str
         Path to save the stabilogram plot.
     """
-    plt.figure(figsize=(12, 8))
+    rms_ml, rms_ap = compute_rms(cop_x, cop_y)
+
+    fig = _reuse_figure("stabilogram", (12, 8), nrows=2)
+    ax_ml, ax_ap = fig.axes
 
     # Subplot for ML displacement
-    plt.subplot(2, 1, 1)
-    plt.plot(time, cop_x, color="black", linewidth=2)
-    plt.title("Stabilogram - ML Displacement")
-    plt.xlabel("Time (s)")
-    plt.ylabel("ML Displacement (cm)")
-    plt.grid(True)
+    # Long recordings are embedded as an image in the SVG instead of a huge path
+    ax_ml.plot(time, cop_x, color="black", linewidth=2, rasterized=True)
+    ax_ml.set_title("Stabilogram - ML Displacement")
+    ax_ml.set_xlabel("Time (s)")
+    ax_ml.set_ylabel("ML Displacement (cm)")
+    ax_ml.grid(True)
 
     # Calculate and display min, max, and RMS
     min_ml = np.min(cop_x)
     max_ml = np.max(cop_x)
-    rms_ml = np.sqrt(np.mean(cop_x**2))
-    plt.axhline(min_ml, color="grey", linestyle="--", label=f"Min: {min_ml:.2f} cm")
-    plt.axhline(max_ml, color="grey", linestyle="-.", label=f"Max: {max_ml:.2f} cm")
-    plt.axhline(rms_ml, color="grey", linestyle=":", label=f"RMS: {rms_ml:.2f} cm")
-    plt.legend()
+    ax_ml.axhline(min_ml, color="grey", linestyle="--", label=f"Min: {min_ml:.2f} cm")
+    ax_ml.axhline(max_ml, color="grey", linestyle="-.", label=f"Max: {max_ml:.2f} cm")
+    ax_ml.axhline(rms_ml, color="grey", linestyle=":", label=f"RMS: {rms_ml:.2f} cm")
+    ax_ml.legend()
 
     # Subplot for AP displacement
-    plt.subplot(2, 1, 2)
-    plt.plot(time, cop_y, color="black", linewidth=2)
-    plt.title("Stabilogram - AP Displacement")
-    plt.xlabel("Time (s)")
-    plt.ylabel("AP Displacement (cm)")
-    plt.grid(True)
+    ax_ap.plot(time, cop_y, color="black", linewidth=2, rasterized=True)
+    ax_ap.set_title("Stabilogram - AP Displacement")
+    ax_ap.set_xlabel("Time (s)")
+    ax_ap.set_ylabel("AP Displacement (cm)")
+    ax_ap.grid(True)
 
     # Calculate and display min, max, and RMS
     min_ap = np.min(cop_y)
     max_ap = np.max(cop_y)
-    rms_ap = np.sqrt(np.mean(cop_y**2))
-    plt.axhline(min_ap, color="grey", linestyle="--", label=f"Min: {min_ap:.2f} cm")
-    plt.axhline(max_ap, color="grey", linestyle="-.", label=f"Max: {max_ap:.2f} cm")
-    plt.axhline(rms_ap, color="grey", linestyle=":", label=f"RMS: {rms_ap:.2f} cm")
-    plt.legend()
+    ax_ap.axhline(min_ap, color="grey", linestyle="--", label=f"Min: {min_ap:.2f} cm")
+    ax_ap.axhline(max_ap, color="grey", linestyle="-.", label=f"Max: {max_ap:.2f} cm")
+    ax_ap.axhline(rms_ap, color="grey", linestyle=":", label=f"RMS: {rms_ap:.2f} cm")
+    ax_ap.legend()
 
-    plt.tight_layout()
-    plt.savefig(f"{output_path}_stabilogram.png", dpi=300)
-    plt.savefig(f"{output_path}_stabilogram.svg", dpi=300)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f"{output_path}_stabilogram.png", dpi=300)
+    fig.savefig(f"{output_path}_stabilogram.svg", dpi=300)
 
 
 def plot_power_spectrum(freqs_ml, psd_ml, freqs_ap, psd_ap, output_path):
     """
     Plots and saves the power spectrum of the CoP signals in PNG and SVG formats, including indicators for maximum PSD values and frequencies.
 
+    The figure is reused between calls and is not thread-safe.
+
     Parameters:
     - freqs_ml: array-like
         Frequencies for ML PSD.
@@ -305,13 +510,14 @@ def plot_power_spectrum(freqs_ml, psd_ml, freqs_ap, psd_ap, output_path):
     - output_path: str
         Path to save the power spectrum plot.
     """
-    plt.figure(figsize=(10, 8))
-    plt.semilogy(freqs_ml, psd_ml, label="ML")
-    plt.semilogy(freqs_ap, psd_ap, label="AP")
-    plt.xlabel("Frequency (Hz)")
-    plt.ylabel("PSD (cm²/Hz)")
-    plt.title("Power Spectral Density")
-    plt.grid(True)
+    fig = _reuse_figure("psd", (10, 8))
+    (ax,) = fig.axes
+    ax.semilogy(freqs_ml, psd_ml, label="ML", rasterized=True)
+    ax.semilogy(freqs_ap, psd_ap, label="AP", rasterized=True)
+    ax.set_xlabel("Frequency (Hz)")
+    ax.set_ylabel("PSD (cm²/Hz)")
+    ax.set_title("Power Spectral Density")
+    ax.grid(True)
 
     # Find maximum PSD values and their frequencies
     max_psd_ml = np.max(psd_ml)
@@ -320,14 +526,14 @@ def plot_power_spectrum(freqs_ml, psd_ml, freqs_ap, psd_ap, output_path):
     max_freq_ap = freqs_ap[np.argmax(psd_ap)]
 
     # Plot markers for maximum PSD values
-    plt.scatter(
+    ax.scatter(
         max_freq_ml,
         max_psd_ml,
         color="blue",
         marker="v",
         label=f"Max ML PSD: {max_psd_ml:.2e} at {max_freq_ml:.2f} Hz",
     )
-    plt.scatter(
+    ax.scatter(
         max_freq_ap,
         max_psd_ap,
         color="orange",
@@ -340,23 +546,22 @@ def plot_power_spectrum(freqs_ml, psd_ml, freqs_ap, psd_ap, output_path):
     median_freq_ap = np.median(freqs_ap)
 
     # Plot vertical lines for median frequencies
-    plt.axvline(
+    ax.axvline(
         median_freq_ml,
         color="blue",
         linestyle="--",
         label=f"Median ML Frequency: {median_freq_ml:.2f} Hz",
     )
-    plt.axvline(
+    ax.axvline(
         median_freq_ap,
         color="orange",
         linestyle="--",
         label=f"Median AP Frequency: {median_freq_ap:.2f} Hz",
     )
 
-    plt.legend()
-    plt.savefig(f"{output_path}_psd.png", dpi=300)
-    plt.savefig(f"{output_path}_psd.svg", dpi=300)
-    plt.close()
+    ax.legend()
+    fig.savefig(f"{output_path}_psd.png", dpi=300)
+    fig.savefig(f"{output_path}_psd.svg", dpi=300)
 
 
 def save_metrics_to_csv(metrics_dict, output_path):
@@ -369,20 +574,23 @@ def save_metrics_to_csv(metrics_dict, output_path):
     - output_path: str
         Path to save the metrics CSV file.
     """
-    import pandas as pd
-
     # Standardize headers
     standardized_metrics = {}
     for key, value in metrics_dict.items():
-        new_key = (
-            key.replace(" ", "_")
-            .replace("(", "_")
-            .replace(")", "")
-            .replace("²", "2")
-            .replace("·", "_")
-            .replace("³", "3")
-        )
+        new_key = key.translate(HEADER_TRANSLATION)
         standardized_metrics[new_key] = value
 
-    df = pd.DataFrame([standardized_metrics])
-    df.to_csv(f"{output_path}_metrics.csv", index=False)
+    # One header row and one value row; missing values are left empty
+    values = [
+        (
+            ""
+            if value is None
+            or (isinstance(value, (float, np.floating)) and np.isnan(value))
+            else value
+        )
+        for value in standardized_metrics.values()
+    ]
+    with open(f"{output_path}_metrics.csv", "w", newline="") as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(standardized_metrics.keys())
+        writer.writerow(values)